@@ -12,15 +12,51 @@ import os
 import sys
 import stat
 import shutil
+import sqlite3
+import hashlib
+import threading
+import time
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, Counter
 from abc import ABC, abstractmethod
 from enum import Enum
 import json
-from PIL import Image
 import logging
+import logging.handlers
+from contextlib import contextmanager
+
+
+# Section separators shared by the report views
+_SEP60 = "=" * 60 + "\n"
+_RULE60 = "-" * 60 + "\n"
+_RULE40 = "-" * 40 + "\n"
+_RULE30 = "-" * 30 + "\n"
+
+# Number formatting for the report views. Type totals, counts and percentages
+# repeat between renders, so the formatted strings are memoized; per-file sizes
+# are almost all distinct and are formatted inline instead.
+@lru_cache(maxsize=4096)
+def _fmt_mb(size_mb: float) -> str:
+    """Format a size in MB with one decimal"""
+    return f"{size_mb:.1f}"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_pct(percentage: float) -> str:
+    """Format a percentage with one decimal"""
+    return f"{percentage:.1f}"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_int(count: int) -> str:
+    """Format a count with thousands separators"""
+    return f"{count:,}"
 
 
 class OperationLogger:
@@ -138,6 +174,48 @@ class OperationLogger:
         """Log an error"""
         self.log_operation(error_type, error_message, success=False)
     
+    @contextmanager
+    def batch(self):
+        """
+        Hold back log file writes and make them together when the block exits
+        
+        For the duration of the block a MemoryHandler stands in for the root
+        logger's file handler, so records are kept in memory and handed to the
+        file handler on exit. A batch opened while another one is active, from
+        any OperationLogger, joins it.
+        """
+        root = logging.getLogger()
+        file_handler = next((h for h in root.handlers if isinstance(h, logging.FileHandler)), None)
+        if file_handler is None:  # Already batching, or logging could not be set up
+            yield self
+            return
+        
+        buffer = logging.handlers.MemoryHandler(sys.maxsize, flushLevel=logging.CRITICAL, target=file_handler)
+        buffer.setLevel(file_handler.level)
+        # Swapped in place under the file handler's lock, so a concurrent batch
+        # sees either the file handler or this buffer, and no record reaches both
+        with file_handler.lock:
+            if file_handler not in root.handlers:
+                buffer = None
+            else:
+                root.handlers[root.handlers.index(file_handler)] = buffer
+        if buffer is None:
+            yield self
+            return
+        
+        try:
+            yield self
+        finally:
+            with file_handler.lock:
+                root.handlers[root.handlers.index(buffer)] = file_handler
+            buffer.close()  # Writes out the held records
+    
+    def flush(self):
+        """Write out any records held back by an open batch"""
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, logging.handlers.MemoryHandler):
+                handler.flush()
+    
     def get_operation_history(self, limit: int = 100) -> List[Dict]:
         """
         Get recent operation history
@@ -148,10 +226,12 @@ class OperationLogger:
         Returns:
             List of operation dictionaries
         """
+        self.flush()
         return self.operation_history[-limit:]
     
     def get_log_file_path(self) -> str:
         """Get the path to the log file"""
+        self.flush()
         return str(self.log_file_path.absolute())
     
     def clear_history(self):
@@ -170,6 +250,10 @@ class AIConfig:
     
     CONFIG_FILE = "ai_config.json"
     
+    # Parsed config file contents keyed by (path, mtime, size), so repeated
+    # loads skip the JSON parse until the file changes
+    _file_cache: Dict[Tuple[str, int, int], Dict] = {}
+    
     @staticmethod
     def load_config() -> Dict:
         """
@@ -180,15 +264,22 @@ class AIConfig:
         """
         config = {
             'provider': 'claude',
-            'claude_api_key': ''
+            'claude_api_key': '',
+            'scan_cache': None  # Database path, "off" to disable; None uses ScanCache.DB_PATH
         }
         
         # Try to load from config file
         try:
             if os.path.exists(AIConfig.CONFIG_FILE):
-                with open(AIConfig.CONFIG_FILE, 'r') as f:
-                    file_config = json.load(f)
-                    config.update(file_config)
+                file_stat = os.stat(AIConfig.CONFIG_FILE)
+                key = (AIConfig.CONFIG_FILE, file_stat.st_mtime_ns, file_stat.st_size)
+                file_config = AIConfig._file_cache.get(key)
+                if file_config is None:
+                    with open(AIConfig.CONFIG_FILE, 'r') as f:
+                        file_config = json.load(f)
+                    AIConfig._file_cache.clear()
+                    AIConfig._file_cache[key] = file_config
+                config.update(file_config)
         except Exception as e:
             print(f"Warning: Could not load config file: {str(e)}")
         
@@ -197,6 +288,8 @@ class AIConfig:
             config['claude_api_key'] = os.environ.get('CLAUDE_API_KEY')
         if os.environ.get('AI_PROVIDER'):
             config['provider'] = os.environ.get('AI_PROVIDER')
+        if os.environ.get('BUZZSORT_SCAN_CACHE'):
+            config['scan_cache'] = os.environ.get('BUZZSORT_SCAN_CACHE')
         
         return config
     
@@ -214,6 +307,7 @@ class AIConfig:
         try:
             with open(AIConfig.CONFIG_FILE, 'w') as f:
                 json.dump(config, f, indent=2)
+            AIConfig._file_cache.clear()
             return True
         except Exception as e:
             print(f"Error saving config: {str(e)}")
@@ -288,11 +382,38 @@ class AIServiceInterface(ABC):
             True if connection successful, False otherwise
         """
         pass
+    
+    def analyze_batch(self, tasks: List[Dict]) -> List[Dict]:
+        """
+        Run several analyses, in one request where the provider supports it
+        
+        Each task is {'op': 'filenames', 'files': [...]} or
+        {'op': 'text', 'name': filename, 'content': text_preview}. This default
+        runs them one by one; providers override it to combine them.
+        
+        Args:
+            tasks: Task descriptors
+            
+        Returns:
+            One result per task, in order, shaped like analyze_filenames or
+            analyze_text_content would return it
+        """
+        results = []
+        for task in tasks:
+            if task.get('op') == 'filenames':
+                results.append(self.analyze_filenames(task['files']))
+            elif task.get('op') == 'text':
+                results.append(self.analyze_text_content(task['name'], task['content']))
+            else:
+                results.append({'error': f"Unknown analysis task: {task.get('op')}"})
+        return results
 
 
 class ClaudeService(AIServiceInterface):
     """Anthropic Claude AI service implementation"""
     
+    MAX_RETRIES = 3  # Attempts after the first for transient API failures
+    
     def __init__(self, api_key: str):
         """
         Initialize Claude service
@@ -312,7 +433,9 @@ class ClaudeService(AIServiceInterface):
                 raise ValueError("API key is empty or invalid")
             
             import anthropic
-            self.client = anthropic.Anthropic(api_key=self.api_key)
+            # The SDK retries connection errors, timeouts, 429s and 5xx responses
+            # itself, with jittered exponential backoff that honours Retry-After
+            self.client = anthropic.Anthropic(api_key=self.api_key, max_retries=self.MAX_RETRIES)
             
         except ValueError as e:
             raise RuntimeError(f"Invalid API key: {str(e)}")
@@ -342,16 +465,16 @@ class ClaudeService(AIServiceInterface):
                     'error': 'No filenames provided for analysis'
                 }
             
-            # Limit batch size to avoid token limits
+            # Limit batch size to avoid token limits; the prompt lines are built
+            # in one pass over the first batch_size names, without copying the list
             batch_size = 100
-            if len(filenames) > batch_size:
-                filenames = filenames[:batch_size]
+            filename_lines = [f"- {name}" for name in islice(filenames, batch_size)]
             
             # Create prompt for filename clustering
-            prompt = f"""Analyze these {len(filenames)} filenames and group them into logical categories based on their names, patterns, and likely content.
+            prompt = f"""Analyze these {len(filename_lines)} filenames and group them into logical categories based on their names, patterns, and likely content.
 
 Filenames:
-{chr(10).join(f"- {name}" for name in filenames)}
+{chr(10).join(filename_lines)}
 
 Please organize these files into 3-7 meaningful clusters. For each cluster:
 1. Give it a descriptive category name
@@ -537,6 +660,95 @@ Format your response as JSON:
                 'error': f'Analysis failed: {str(e)}'
             }
     
+    def analyze_batch(self, tasks: List[Dict]) -> List[Dict]:
+        """
+        Run several filename/text analyses in a single Claude request
+        
+        Args:
+            tasks: Task descriptors, see AIServiceInterface.analyze_batch
+            
+        Returns:
+            One result per task, in order
+        """
+        def failed(task: Dict, error: str) -> Dict:
+            if task.get('op') == 'text':
+                return {'purpose': 'Unknown', 'suggested_name': task.get('name', ''), 'error': error}
+            return {'clusters': [], 'error': error}
+        
+        if not tasks:
+            return []
+        if not self.client:
+            return [failed(task, 'AI model not initialized. Check your API key configuration.') for task in tasks]
+        
+        # Describe every task in one prompt and ask for the answers as a JSON array
+        sections = []
+        for number, task in enumerate(tasks, 1):
+            if task.get('op') == 'filenames':
+                filename_lines = "\n".join(f"- {name}" for name in islice(task['files'], 100))
+                sections.append(f"""Task {number} (filenames): group these filenames into 3-7 meaningful clusters.
+{filename_lines}
+Answer with {{"clusters": [{{"category": "Category Name", "files": ["file1.txt"], "description": "Brief explanation", "suggested_folder": "suggested_folder_name"}}]}}""")
+            elif task.get('op') == 'text':
+                sections.append(f"""Task {number} (document): suggest a better, more descriptive filename for this document.
+Current filename: {task['name']}
+Document content preview:
+{task['content'][:2000]}
+Answer with {{"purpose": "Brief description of document purpose", "suggested_name": "better_filename.ext", "explanation": "Why this name is better", "confidence": "high/medium/low"}}""")
+            else:
+                return [failed(t, f"Unknown analysis task: {task.get('op')}") for t in tasks]
+        
+        prompt = ("Complete each of the following tasks.\n\n" + "\n\n".join(sections) +
+                  f"\n\nFormat your response as a JSON array with exactly {len(tasks)} objects, "
+                  "the answer to each task in task order.")
+        
+        try:
+            message = self.client.messages.create(
+                model=self.model,
+                max_tokens=2048 + 1024 * (len(tasks) - 1),
+                messages=[{"role": "user", "content": prompt}]
+            )
+            if not message or not message.content:
+                return [failed(task, 'Empty response from API') for task in tasks]
+            
+            # Extract text from response
+            response_text = message.content[0].text.strip()
+            
+            # Remove markdown code blocks if present
+            if response_text.startswith('```json'):
+                response_text = response_text[7:]
+            if response_text.startswith('```'):
+                response_text = response_text[3:]
+            if response_text.endswith('```'):
+                response_text = response_text[:-3]
+            
+            answers = json.loads(response_text.strip())
+        except json.JSONDecodeError as e:
+            return [failed(task, f'Failed to parse AI response: {str(e)}') for task in tasks]
+        except Exception as e:
+            return [failed(task, f'API request failed: {str(e)}') for task in tasks]
+        
+        if not isinstance(answers, list) or len(answers) != len(tasks):
+            return [failed(task, 'AI returned invalid response format. Try again.') for task in tasks]
+        
+        results = []
+        for task, answer in zip(tasks, answers):
+            if not isinstance(answer, dict):
+                results.append(failed(task, 'AI returned invalid response format. Try again.'))
+            elif task['op'] == 'filenames':
+                if answer.get('clusters'):
+                    results.append({'clusters': answer['clusters'], 'total_files': len(task['files']), 'error': None})
+                else:
+                    results.append(failed(task, 'AI did not return any file clusters. Try with different files.'))
+            else:
+                results.append({
+                    'purpose': answer.get('purpose', 'Unknown'),
+                    'suggested_name': answer.get('suggested_name', task['name']),
+                    'explanation': answer.get('explanation', ''),
+                    'confidence': answer.get('confidence', 'medium'),
+                    'error': None
+                })
+        return results
+    
     def analyze_image(self, image_path: str) -> Dict:
         """
         Analyze image using Claude Vision API
@@ -699,10 +911,15 @@ Format your response as JSON:
 class AIServiceFactory:
     """Factory class for creating AI service instances"""
     
-    @staticmethod
-    def create_service(provider: AIProvider, api_key: str) -> AIServiceInterface:
+    # One service per (provider, SHA-256 of the API key), so its HTTP client and
+    # connection pool are reused instead of rebuilt on every create_service call
+    _instances: Dict[Tuple[AIProvider, str], AIServiceInterface] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def create_service(cls, provider: AIProvider, api_key: str) -> AIServiceInterface:
         """
-        Create an AI service instance based on provider
+        Get the AI service instance for a provider and key, creating it on first use
         
         Args:
             provider: AIProvider enum value
@@ -714,17 +931,169 @@ class AIServiceFactory:
         Raises:
             ValueError: If provider is not supported
         """
+        key = (provider, hashlib.sha256(api_key.encode('utf-8')).hexdigest())
+        with cls._lock:
+            service = cls._instances.get(key)
+            if service is None:
+                service = cls._build_service(provider, api_key)
+                cls._instances[key] = service
+            return service
+    
+    @staticmethod
+    def _build_service(provider: AIProvider, api_key: str) -> AIServiceInterface:
+        """Construct a new service instance for a provider"""
         if provider == AIProvider.CLAUDE:
             return ClaudeService(api_key)
         else:
             raise ValueError(f"Unsupported AI provider: {provider}")
 
 
+class ScanCache:
+    """Persists file metadata and AI clustering results between runs in SQLite"""
+    
+    DB_PATH = os.path.expanduser("~/.buzzsort_cache.db")
+    MAX_FILES = 200000  # File rows kept before the least recently used are evicted
+    MAX_CLUSTERS = 1000  # AI clustering results kept, same eviction policy
+    
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Open (or create) the cache database
+        
+        Args:
+            db_path: Database file, defaults to DB_PATH
+            
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        self.db_path = db_path or self.DB_PATH
+        # Scans and AI analysis run on worker threads; one lock serializes them
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS files(
+                    path TEXT PRIMARY KEY, size INTEGER, mtime REAL, type TEXT,
+                    json_blob TEXT, last_used REAL);
+                CREATE INDEX IF NOT EXISTS files_last_used ON files(last_used);
+                CREATE TABLE IF NOT EXISTS clusters(
+                    key TEXT PRIMARY KEY, json_blob TEXT, last_used REAL);
+            """)
+    
+    def _prefix_range(self, root: str) -> Tuple[str, str]:
+        """Return the [low, high) key range covering every path below root"""
+        low = os.path.join(root, '')
+        return low, low[:-1] + chr(ord(low[-1]) + 1)
+    
+    def load_files(self, root: str) -> Dict[str, Tuple[int, float, Dict]]:
+        """
+        Load cached metadata for every file below a directory in one query
+        
+        Args:
+            root: Absolute directory path
+            
+        Returns:
+            Dictionary mapping path to (size, mtime, file_info)
+        """
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT path, size, mtime, json_blob FROM files WHERE path >= ? AND path < ?",
+                    self._prefix_range(root)
+                ).fetchall()
+        except sqlite3.Error as e:
+            logging.warning(f"Scan cache read failed: {str(e)}")
+            return {}
+        
+        return {path: (size, mtime, json.loads(blob)) for path, size, mtime, blob in rows}
+    
+    def store_files(self, root: str, fresh: List[Tuple[Dict, float]], stale: List[str]):
+        """
+        Record the outcome of a scan of root
+        
+        Args:
+            root: Absolute directory path that was scanned
+            fresh: (file_info, mtime) pairs for files that were new or changed
+            stale: Cached paths that no longer exist
+        """
+        now = datetime.now().timestamp()
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany("DELETE FROM files WHERE path = ?", ((path,) for path in stale))
+                self._conn.execute("UPDATE files SET last_used = ? WHERE path >= ? AND path < ?",
+                                   (now, *self._prefix_range(root)))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                    ((info['path'], info['size'], mtime, info['type'], json.dumps(info), now)
+                     for info, mtime in fresh)
+                )
+                self._evict('files', 'path', self.MAX_FILES)
+        except sqlite3.Error as e:
+            logging.warning(f"Scan cache write failed: {str(e)}")
+    
+    def _cluster_key(self, filenames: List[str]) -> str:
+        """Hash a set of filenames independently of their order"""
+        return hashlib.sha1("\0".join(sorted(filenames)).encode('utf-8')).hexdigest()
+    
+    def get_clusters(self, filenames: List[str]) -> Optional[Dict]:
+        """
+        Look up a previous AI clustering of exactly these filenames
+        
+        Args:
+            filenames: Filenames that were sent for analysis
+            
+        Returns:
+            The cached analysis result, or None on a miss
+        """
+        key = self._cluster_key(filenames)
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute("SELECT json_blob FROM clusters WHERE key = ?", (key,)).fetchone()
+                if row:
+                    self._conn.execute("UPDATE clusters SET last_used = ? WHERE key = ?",
+                                       (datetime.now().timestamp(), key))
+        except sqlite3.Error as e:
+            logging.warning(f"Scan cache read failed: {str(e)}")
+            return None
+        
+        return json.loads(row[0]) if row else None
+    
+    def store_clusters(self, filenames: List[str], result: Dict):
+        """
+        Remember a successful AI clustering of a set of filenames
+        
+        Args:
+            filenames: Filenames that were sent for analysis
+            result: Analysis result from AIServiceInterface.analyze_filenames
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("INSERT OR REPLACE INTO clusters VALUES (?, ?, ?)",
+                                   (self._cluster_key(filenames), json.dumps(result),
+                                    datetime.now().timestamp()))
+                self._evict('clusters', 'key', self.MAX_CLUSTERS)
+        except sqlite3.Error as e:
+            logging.warning(f"Scan cache write failed: {str(e)}")
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+    
+    def _evict(self, table: str, key_column: str, max_rows: int):
+        """Drop the least recently used rows beyond max_rows (caller holds the lock)"""
+        self._conn.execute(
+            f"DELETE FROM {table} WHERE {key_column} IN "
+            f"(SELECT {key_column} FROM {table} ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (max_rows,)
+        )
+
+
 class FileScanner:
     """Handles directory scanning and file metadata extraction"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ScanCache] = None):
         self.scan_errors = []
+        self.cache = cache  # Optional ScanCache; unchanged files are not rebuilt
     
     def extract_text_preview(self, file_path: str, max_chars: int = 2000) -> Optional[str]:
         """
@@ -765,12 +1134,15 @@ class FileScanner:
             self.scan_errors.append(f"Could not extract text from {file_path}: {str(e)}")
             return None
     
-    def scan_directory(self, path: str) -> List[Dict]:
+    def scan_directory(self, path: str, chunk_callback=None, chunk_size: int = 500) -> List[Dict]:
         """
         Scan directory recursively and return list of file information dictionaries
         
         Args:
             path: Directory path to scan
+            chunk_callback: Optional callable receiving each batch of newly scanned files
+                while the walk is still running
+            chunk_size: Number of files per chunk_callback batch
             
         Returns:
             List of dictionaries containing file metadata
@@ -788,25 +1160,34 @@ class FileScanner:
                 self.scan_errors.append(f"Path is not a directory: {path}")
                 return files
             
-            # Recursively scan all files
+            # Recursively scan all files, reusing cached metadata for files
+            # whose size and mtime have not changed since the last scan
+            root = os.path.abspath(path)
+            cached = self.cache.load_files(root) if self.cache else {}
+            fresh = []
+            unreadable = []
             try:
-                for file_path in root_path.rglob('*'):
-                    try:
-                        if file_path.is_file():
-                            file_info = self.get_file_info(str(file_path))
-                            if file_info:  # Only add if we successfully got file info
-                                files.append(file_info)
-                    except PermissionError:
-                        self.scan_errors.append(f"Permission denied: {file_path.name}")
-                    except OSError as e:
-                        self.scan_errors.append(f"Cannot access: {file_path.name} - {str(e)}")
-                    except Exception as e:
-                        self.scan_errors.append(f"Error reading: {file_path.name} - {str(e)}")
-                        
+                for file_info in self._walk(root, cached, fresh, unreadable):
+                    files.append(file_info)
+                    if chunk_callback and len(files) % chunk_size == 0:
+                        chunk_callback(files[-chunk_size:])
+                if self.cache:
+                    # Whatever _walk did not claim from cached has been deleted,
+                    # except below entries it could not read, which were not seen
+                    unseen = set(unreadable)
+                    skipped = tuple(os.path.join(entry, '') for entry in unreadable)
+                    stale = [cached_path for cached_path in cached
+                             if cached_path not in unseen and not cached_path.startswith(skipped)]
+                    self.cache.store_files(root, fresh, stale)
             except PermissionError:
                 self.scan_errors.append(f"Permission denied accessing some folders in: {path}")
             except OSError as e:
                 self.scan_errors.append(f"System error scanning directory: {str(e)}")
+            
+            # Hand over the partial last batch, also when the walk stopped early
+            remainder = len(files) % chunk_size
+            if chunk_callback and remainder:
+                chunk_callback(files[-remainder:])
                         
         except PermissionError:
             self.scan_errors.append(f"Permission denied: Cannot access directory '{path}'")
@@ -817,6 +1198,111 @@ class FileScanner:
         
         return files
     
+    def _walk(self, directory: str, cached: Dict[str, Tuple[int, float, Dict]],
+              fresh: List[Tuple[Dict, float]], unreadable: List[str]):
+        """
+        Recursively yield file metadata using os.scandir
+        
+        DirEntry caches the type information from the directory listing, and
+        its stat() result is reused for size and dates, so each file costs one
+        stat call at most instead of the several made by Path.rglob/is_file/stat.
+        Symlinked directories are not followed, matching rglob.
+        
+        Args:
+            directory: Absolute directory path to walk
+            cached: Cached (size, mtime, file_info) by path; entries are popped as files are seen
+            fresh: Receives (file_info, mtime) for files missing from or changed since the cache
+            unreadable: Receives the paths of entries (files or whole subtrees) that raised
+            
+        Yields:
+            File metadata dictionaries in the format of get_file_info
+        """
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self._walk(entry.path, cached, fresh, unreadable)
+                    elif entry.is_file():
+                        file_stats = entry.stat()
+                        hit = cached.pop(entry.path, None)
+                        if hit and hit[0] == file_stats.st_size and hit[1] == file_stats.st_mtime:
+                            yield hit[2]
+                        else:
+                            file_info = self._build_file_info(entry.path, entry.name, file_stats)
+                            fresh.append((file_info, file_stats.st_mtime))
+                            yield file_info
+                except PermissionError:
+                    unreadable.append(entry.path)
+                    self.scan_errors.append(f"Permission denied: {entry.name}")
+                except OSError as e:
+                    unreadable.append(entry.path)
+                    self.scan_errors.append(f"Cannot access: {entry.name} - {str(e)}")
+                except Exception as e:
+                    unreadable.append(entry.path)
+                    self.scan_errors.append(f"Error reading: {entry.name} - {str(e)}")
+    
+    def scan_directory_lite(self, path: str):
+        """
+        Recursively yield (name, extension) for every file without stat'ing it
+        
+        For callers that only count or group files by extension. The file and
+        directory checks are answered from the directory listing, so no stat
+        call is made per file. Errors are collected in scan_errors as usual.
+        
+        Args:
+            path: Directory path to scan
+            
+        Yields:
+            (name, extension) tuples; extension is lower case with the dot, as in get_file_info
+        """
+        self.scan_errors = []
+        pending = [os.path.abspath(path)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file():
+                                extension = os.path.splitext(entry.name)[1].lower()
+                                yield entry.name, ('' if extension == '.' else extension)
+                        except OSError as e:
+                            self.scan_errors.append(f"Cannot access: {entry.name} - {str(e)}")
+            except FileNotFoundError:
+                self.scan_errors.append(f"Directory does not exist: {directory}")
+            except PermissionError:
+                self.scan_errors.append(f"Permission denied: Cannot access directory '{directory}'")
+            except OSError as e:
+                self.scan_errors.append(f"System error: Cannot read directory '{directory}' - {str(e)}")
+    
+    def _build_file_info(self, path: str, name: str, file_stats: os.stat_result) -> Dict:
+        """
+        Build the metadata dictionary for a file from an existing stat result
+        
+        Args:
+            path: Absolute path to the file
+            name: File name
+            file_stats: Result of stat() for the file
+            
+        Returns:
+            Dictionary with file metadata
+        """
+        extension = os.path.splitext(name)[1].lower()
+        if extension == '.':  # Path.suffix treats a trailing dot as no extension
+            extension = ''
+        
+        return {
+            'path': path,
+            'name': name,
+            'extension': extension,
+            'size': file_stats.st_size,
+            'modified_date': datetime.fromtimestamp(file_stats.st_mtime).isoformat(),
+            'created_date': datetime.fromtimestamp(file_stats.st_ctime).isoformat(),
+            'type': self._categorize_file_type(extension)
+        }
+    
     def get_file_info(self, file_path: str) -> Optional[Dict]:
         """
         Extract metadata from a single file
@@ -833,18 +1319,7 @@ class FileScanner:
             # Get file stats
             file_stats = path_obj.stat()
             
-            # Extract basic information
-            file_info = {
-                'path': str(path_obj.absolute()),
-                'name': path_obj.name,
-                'extension': path_obj.suffix.lower(),
-                'size': file_stats.st_size,
-                'modified_date': datetime.fromtimestamp(file_stats.st_mtime).isoformat(),
-                'created_date': datetime.fromtimestamp(file_stats.st_ctime).isoformat(),
-                'type': self._categorize_file_type(path_obj.suffix.lower())
-            }
-            
-            return file_info
+            return self._build_file_info(str(path_obj.absolute()), path_obj.name, file_stats)
             
         except PermissionError:
             self.scan_errors.append(f"Permission denied accessing file: {file_path}")
@@ -926,30 +1401,44 @@ class FileScanner:
         Returns:
             Dictionary with type categories and their statistics
         """
-        grouped = self.group_by_type(files)
-        stats = {}
+        return self.update_file_type_stats({}, files)
+    
+    def update_file_type_stats(self, stats: Dict[str, Dict], files: List[Dict]) -> Dict[str, Dict]:
+        """
+        Fold a batch of files into running file type statistics
         
-        for file_type, file_list in grouped.items():
-            if not file_list:
-                continue
-                
-            total_size = sum(f['size'] for f in file_list)
-            extensions = defaultdict(int)
+        Lets a scan report statistics as it goes without recomputing them over
+        every file seen so far.
+        
+        Args:
+            stats: Statistics from get_file_type_stats or a previous call, updated in place
+            files: Newly scanned file information dictionaries
             
-            for file_info in file_list:
-                ext = file_info['extension'] or 'no extension'
-                extensions[ext] += 1
+        Returns:
+            The updated stats dictionary
+        """
+        for file_info in files:
+            file_type = file_info.get('type', 'other')
+            type_stats = stats.get(file_type)
+            if type_stats is None:
+                type_stats = stats[file_type] = {
+                    'count': 0,
+                    'total_size': 0,
+                    'total_size_mb': 0.0,
+                    'common_extensions': [],
+                    'extensions': Counter(),
+                    'files': []
+                }
             
+            type_stats['count'] += 1
+            type_stats['total_size'] += file_info['size']
+            type_stats['extensions'][file_info['extension'] or 'no extension'] += 1
+            type_stats['files'].append(file_info)
+        
+        for type_stats in stats.values():
+            type_stats['total_size_mb'] = type_stats['total_size'] / (1024 * 1024)
             # Get most common extensions (top 3)
-            common_extensions = sorted(extensions.items(), key=lambda x: x[1], reverse=True)[:3]
-            
-            stats[file_type] = {
-                'count': len(file_list),
-                'total_size': total_size,
-                'total_size_mb': total_size / (1024 * 1024),
-                'common_extensions': common_extensions,
-                'files': file_list
-            }
+            type_stats['common_extensions'] = type_stats['extensions'].most_common(3)
         
         return stats
     
@@ -1130,6 +1619,7 @@ class OrganizationPlanner:
             self.plan = {
                 'folders_to_create': folders_to_create,
                 'file_operations': file_operations,
+                'ops_by_folder': self.group_operations_by_folder(file_operations, folders_to_create),
                 'summary': summary,
                 'error': None
             }
@@ -1144,6 +1634,29 @@ class OrganizationPlanner:
                 'error': str(e)
             }
     
+    def group_operations_by_folder(self, file_operations: List[Dict],
+                                   folders: Optional[List[str]] = None) -> Dict[str, List[Dict]]:
+        """
+        Group file operations by destination folder for display
+        
+        Args:
+            file_operations: List of file operation dictionaries
+            folders: Sorted folder names expected to receive operations (e.g. folders_to_create),
+                used to pre-seed the groups
+            
+        Returns:
+            Dictionary mapping folder name to its operations, in sorted folder order;
+            folders without operations are left out
+        """
+        folders = folders or []
+        groups = {folder: [] for folder in folders}
+        for op in file_operations:
+            groups.setdefault(op.get('destination_folder', 'root'), []).append(op)
+        
+        # Pre-seeded keys are already sorted; only re-sort if other folders turned up
+        ordered = groups if len(groups) == len(folders) else sorted(groups)
+        return {folder: groups[folder] for folder in ordered if groups[folder]}
+    
     def generate_folder_structure(self, clusters: List[Dict]) -> List[str]:
         """
         Generate folder structure based on AI clusters
@@ -1154,7 +1667,8 @@ class OrganizationPlanner:
         Returns:
             List of folder paths to create
         """
-        folders = []
+        # Set membership keeps de-duplication O(1) per cluster
+        folders = set()
         
         for cluster in clusters:
             suggested_folder = cluster.get('suggested_folder', '')
@@ -1167,8 +1681,8 @@ class OrganizationPlanner:
             # Clean folder name (remove invalid characters)
             suggested_folder = self._sanitize_folder_name(suggested_folder)
             
-            if suggested_folder and suggested_folder not in folders:
-                folders.append(suggested_folder)
+            if suggested_folder:
+                folders.add(suggested_folder)
         
         return sorted(folders)
     
@@ -1231,9 +1745,7 @@ class OrganizationPlanner:
             Sanitized filename
         """
         # Split name and extension
-        path_obj = Path(filename)
-        name = path_obj.stem
-        ext = path_obj.suffix
+        name, ext = os.path.splitext(filename)
         
         # Remove or replace invalid characters
         invalid_chars = '<>:"/\\|?*'
@@ -1294,9 +1806,7 @@ class OrganizationPlanner:
                     name_indices[new_name] += 1
                     
                     # Split name and extension
-                    path_obj = Path(new_name)
-                    name = path_obj.stem
-                    ext = path_obj.suffix
+                    name, ext = os.path.splitext(new_name)
                     
                     # Append number
                     numbered_name = f"{name}_{name_indices[new_name]}{ext}"
@@ -1360,9 +1870,23 @@ class OrganizationPlanner:
 class PlanExecutor:
     """Executes file organization plans with safety features"""
     
+    MAX_WORKERS = 8  # Concurrent mkdir/move syscalls
+    
     def __init__(self):
         self.execution_log = []
         self.errors = []
+        self._lock = threading.Lock()  # Guards log/errors appended from worker threads
+    
+    def _record(self, message: str):
+        """Append a message to the execution log (thread-safe)"""
+        with self._lock:
+            self.execution_log.append(message)
+    
+    def _record_error(self, error_msg: str):
+        """Record an error in both the error list and the execution log (thread-safe)"""
+        with self._lock:
+            self.errors.append(error_msg)
+            self.execution_log.append(f"[ERROR] {error_msg}")
     
     def execute_plan(self, plan: Dict, base_path: str, dry_run: bool = True, progress_callback=None) -> Dict:
         """
@@ -1394,31 +1918,49 @@ class PlanExecutor:
             folders_to_create = plan.get('folders_to_create', [])
             file_operations = plan.get('file_operations', [])
             
-            # Step 1: Create folders
-            folders_created = 0
             total_operations = len(folders_to_create) + len(file_operations)
             current_operation = 0
-            
-            for folder in folders_to_create:
-                if self.create_folder(base_path, folder, dry_run):
-                    folders_created += 1
-                current_operation += 1
-                if self.progress_callback:
-                    self.progress_callback(current_operation, total_operations)
-            
-            # Step 2: Execute file operations
-            operations_completed = 0
-            operations_failed = 0
-            
-            for operation in file_operations:
-                success = self._execute_file_operation(base_path, operation, dry_run)
-                if success:
-                    operations_completed += 1
-                else:
-                    operations_failed += 1
-                current_operation += 1
-                if self.progress_callback:
-                    self.progress_callback(current_operation, total_operations)
+            base = Path(base_path)  # Built once and shared by every operation
+            
+            # The work is almost entirely mkdir/rename syscalls, which release
+            # the GIL, so a thread pool lets the OS service them concurrently.
+            # Progress is reported from this thread as futures complete.
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+                # Step 1: Create folders (all must exist before any file moves)
+                folders_created = 0
+                futures = [pool.submit(self.create_folder, base, folder, dry_run)
+                           for folder in folders_to_create]
+                
+                for future in as_completed(futures):
+                    if future.result():
+                        folders_created += 1
+                    current_operation += 1
+                    if self.progress_callback:
+                        self.progress_callback(current_operation, total_operations)
+                
+                # Step 2: Execute file operations. The exists-check in
+                # move_file followed by the rename is not atomic, so operations
+                # aimed at the same destination run in plan order on one worker;
+                # otherwise two moves could both pass the check and the second
+                # would silently overwrite the first.
+                operations_completed = 0
+                operations_failed = 0
+                by_destination = {}
+                for operation in file_operations:
+                    key = self._destination_key(base, operation)
+                    by_destination.setdefault(key, []).append(operation)
+                futures = [pool.submit(self._execute_file_operations, base, operations, dry_run)
+                           for operations in by_destination.values()]
+                
+                for future in as_completed(futures):
+                    for success in future.result():
+                        if success:
+                            operations_completed += 1
+                        else:
+                            operations_failed += 1
+                        current_operation += 1
+                    if self.progress_callback:
+                        self.progress_callback(current_operation, total_operations)
             
             # Generate result summary
             result = {
@@ -1435,7 +1977,8 @@ class PlanExecutor:
             return result
             
         except Exception as e:
-            self.errors.append(f"Critical error during execution: {str(e)}")
+            with self._lock:
+                self.errors.append(f"Critical error during execution: {str(e)}")
             return {
                 'success': False,
                 'error': str(e),
@@ -1445,12 +1988,12 @@ class PlanExecutor:
                 'errors': self.errors.copy()
             }
     
-    def create_folder(self, base_path: str, folder_name: str, dry_run: bool = True) -> bool:
+    def create_folder(self, base_path: Union[str, Path], folder_name: str, dry_run: bool = True) -> bool:
         """
         Create a folder in the base path
         
         Args:
-            base_path: Base directory path
+            base_path: Base directory path (a prebuilt Path is used as-is)
             folder_name: Name of folder to create
             dry_run: If True, simulate without creating
             
@@ -1458,39 +2001,38 @@ class PlanExecutor:
             True if successful (or would be successful in dry-run)
         """
         try:
-            folder_path = Path(base_path) / folder_name
+            if isinstance(base_path, str):
+                base_path = Path(base_path)
+            folder_path = base_path / folder_name
             
             if dry_run:
                 # Simulate folder creation
                 if folder_path.exists():
-                    self.execution_log.append(f"[DRY-RUN] Folder already exists: {folder_name}")
+                    self._record(f"[DRY-RUN] Folder already exists: {folder_name}")
                 else:
-                    self.execution_log.append(f"[DRY-RUN] Would create folder: {folder_name}")
+                    self._record(f"[DRY-RUN] Would create folder: {folder_name}")
                 return True
             else:
                 # Actually create the folder
                 if folder_path.exists():
-                    self.execution_log.append(f"Folder already exists: {folder_name}")
+                    self._record(f"Folder already exists: {folder_name}")
                     return True
                 
                 folder_path.mkdir(parents=True, exist_ok=True)
-                self.execution_log.append(f"Created folder: {folder_name}")
+                self._record(f"Created folder: {folder_name}")
                 return True
                 
         except PermissionError as e:
             error_msg = f"Permission denied creating folder '{folder_name}'. Please check folder permissions."
-            self.errors.append(error_msg)
-            self.execution_log.append(f"[ERROR] {error_msg}")
+            self._record_error(error_msg)
             return False
         except OSError as e:
             error_msg = f"System error creating folder '{folder_name}': Invalid path or disk full"
-            self.errors.append(error_msg)
-            self.execution_log.append(f"[ERROR] {error_msg}")
+            self._record_error(error_msg)
             return False
         except Exception as e:
             error_msg = f"Unexpected error creating folder '{folder_name}': {str(e)}"
-            self.errors.append(error_msg)
-            self.execution_log.append(f"[ERROR] {error_msg}")
+            self._record_error(error_msg)
             return False
     
     def move_file(self, source_path: str, destination_path: str, dry_run: bool = True) -> bool:
@@ -1512,20 +2054,18 @@ class PlanExecutor:
             # Validate source exists
             if not source.exists():
                 error_msg = f"Source file not found: {source.name}"
-                self.errors.append(error_msg)
-                self.execution_log.append(f"[ERROR] {error_msg}")
+                self._record_error(error_msg)
                 return False
             
             # Check if destination already exists
             if destination.exists():
                 error_msg = f"Destination already exists: {destination.name}"
-                self.errors.append(error_msg)
-                self.execution_log.append(f"[ERROR] {error_msg}")
+                self._record_error(error_msg)
                 return False
             
             if dry_run:
                 # Simulate move
-                self.execution_log.append(f"[DRY-RUN] Would move: {source.name} -> {destination}")
+                self._record(f"[DRY-RUN] Would move: {source.name} -> {destination}")
                 return True
             else:
                 # Ensure destination directory exists
@@ -1533,26 +2073,23 @@ class PlanExecutor:
                 
                 # Actually move the file
                 shutil.move(str(source), str(destination))
-                self.execution_log.append(f"Moved: {source.name} -> {destination}")
+                self._record(f"Moved: {source.name} -> {destination}")
                 return True
                 
         except PermissionError:
             error_msg = f"Permission denied: Cannot move '{source.name}'. Check file permissions."
-            self.errors.append(error_msg)
-            self.execution_log.append(f"[ERROR] {error_msg}")
+            self._record_error(error_msg)
             return False
         except OSError as e:
             if "cross-device" in str(e).lower():
                 error_msg = f"Cannot move '{source.name}' across different drives. Try copying instead."
             else:
                 error_msg = f"System error moving '{source.name}': Disk may be full or path invalid"
-            self.errors.append(error_msg)
-            self.execution_log.append(f"[ERROR] {error_msg}")
+            self._record_error(error_msg)
             return False
         except Exception as e:
             error_msg = f"Unexpected error moving '{source.name}': {str(e)}"
-            self.errors.append(error_msg)
-            self.execution_log.append(f"[ERROR] {error_msg}")
+            self._record_error(error_msg)
             return False
     
     def rename_file(self, file_path: str, new_name: str, dry_run: bool = True) -> bool:
@@ -1574,49 +2111,77 @@ class PlanExecutor:
             # Validate source exists
             if not source.exists():
                 error_msg = f"Source file not found: {source.name}"
-                self.errors.append(error_msg)
-                self.execution_log.append(f"[ERROR] {error_msg}")
+                self._record_error(error_msg)
                 return False
             
             # Check if destination already exists
             if destination.exists() and destination != source:
                 error_msg = f"File already exists with name: {new_name}"
-                self.errors.append(error_msg)
-                self.execution_log.append(f"[ERROR] {error_msg}")
+                self._record_error(error_msg)
                 return False
             
             if dry_run:
                 # Simulate rename
-                self.execution_log.append(f"[DRY-RUN] Would rename: {source.name} -> {new_name}")
+                self._record(f"[DRY-RUN] Would rename: {source.name} -> {new_name}")
                 return True
             else:
                 # Actually rename the file
                 source.rename(destination)
-                self.execution_log.append(f"Renamed: {source.name} -> {new_name}")
+                self._record(f"Renamed: {source.name} -> {new_name}")
                 return True
                 
         except PermissionError:
             error_msg = f"Permission denied: Cannot rename '{source.name}'. File may be in use."
-            self.errors.append(error_msg)
-            self.execution_log.append(f"[ERROR] {error_msg}")
+            self._record_error(error_msg)
             return False
         except OSError as e:
             error_msg = f"System error renaming '{source.name}': Invalid filename or disk error"
-            self.errors.append(error_msg)
-            self.execution_log.append(f"[ERROR] {error_msg}")
+            self._record_error(error_msg)
             return False
         except Exception as e:
             error_msg = f"Unexpected error renaming '{source.name}': {str(e)}"
-            self.errors.append(error_msg)
-            self.execution_log.append(f"[ERROR] {error_msg}")
+            self._record_error(error_msg)
             return False
     
-    def _execute_file_operation(self, base_path: str, operation: Dict, dry_run: bool = True) -> bool:
+    @staticmethod
+    def _destination_key(base_path: Path, operation: Dict) -> str:
+        """
+        Build the key used to group operations that write to the same file
+        
+        Args:
+            base_path: Base directory Path
+            operation: File operation dictionary
+            
+        Returns:
+            Case-folded destination path, so names that differ only in case
+            also share a worker on case-insensitive filesystems
+        """
+        new_name = operation.get('new_name', operation.get('original_name', ''))
+        dest_file_path = base_path / operation.get('destination_folder', '') / new_name
+        return str(dest_file_path).casefold()
+    
+    def _execute_file_operations(self, base_path: Path, operations: List[Dict],
+                                 dry_run: bool = True) -> List[bool]:
+        """
+        Execute operations that share a destination, one after another
+        
+        Args:
+            base_path: Base directory Path, built once per execute_plan call
+            operations: File operation dictionaries in plan order
+            dry_run: If True, simulate without executing
+            
+        Returns:
+            List of per-operation success flags
+        """
+        return [self._execute_file_operation(base_path, operation, dry_run)
+                for operation in operations]
+    
+    def _execute_file_operation(self, base_path: Path, operation: Dict, dry_run: bool = True) -> bool:
         """
         Execute a single file operation
         
         Args:
-            base_path: Base directory path
+            base_path: Base directory Path, built once per execute_plan call
             operation: File operation dictionary
             dry_run: If True, simulate without executing
             
@@ -1631,11 +2196,12 @@ class PlanExecutor:
             new_name = operation.get('new_name', original_name)
             
             if not source_path:
-                self.errors.append("Operation missing source path")
+                with self._lock:
+                    self.errors.append("Operation missing source path")
                 return False
             
             # Build destination path
-            dest_folder_path = Path(base_path) / destination_folder
+            dest_folder_path = base_path / destination_folder
             dest_file_path = dest_folder_path / new_name
             
             # Determine operation type
@@ -1653,13 +2219,12 @@ class PlanExecutor:
                 return self.rename_file(source_path, new_name, dry_run)
             else:
                 # No operation needed
-                self.execution_log.append(f"[SKIP] File already in correct location: {original_name}")
+                self._record(f"[SKIP] File already in correct location: {original_name}")
                 return True
                 
         except Exception as e:
             error_msg = f"Failed to execute operation: {str(e)}"
-            self.errors.append(error_msg)
-            self.execution_log.append(f"[ERROR] {error_msg}")
+            self._record_error(error_msg)
             return False
     
     def get_execution_log(self) -> List[str]:
@@ -1728,10 +2293,29 @@ class ToolTip:
 class BuzzSortApp:
     """Main application class for Buzz Sort - Georgia Tech Yellow Jacket Edition"""
     
+    UI_POLL_MS = 50  # How often the Tk thread drains worker messages
+    RENDER_ROW_BUDGET = 500  # Rows of plan/cluster detail rendered before "click to expand"
+    SCAN_ERROR_ROWS = 10  # Scan errors shown per expansion
+    AI_BATCH_SIZE = 100  # Filenames per AI clustering request
+    AI_MAX_WORKERS = 4  # Concurrent AI requests when a folder needs several batches
+    PROGRESS_INTERVAL = 1 / 30  # Minimum seconds between execution progress updates
+    
     def __init__(self):
         self.root = tk.Tk()
         self.selected_folder = None
-        self.scanner = FileScanner()
+        self._folder_basename = None  # Display name of selected_folder, computed once in select_folder
+        
+        # Load AI configuration
+        self.config = AIConfig.load_config()
+        
+        self.scan_cache = None  # Scan without a cache if it is disabled or cannot be opened
+        cache_path = self.config.get('scan_cache')
+        if (cache_path or '').lower() != 'off':
+            try:
+                self.scan_cache = ScanCache(cache_path)
+            except sqlite3.Error:
+                pass  # e.g. read-only home directory
+        self.scanner = FileScanner(cache=self.scan_cache)
         self.planner = OrganizationPlanner()
         self.executor = PlanExecutor()
         self.logger = OperationLogger()  # Initialize logger
@@ -1741,15 +2325,36 @@ class BuzzSortApp:
         self.current_plan = None
         self.is_processing = False  # Track if operation is in progress
         
-        # Load AI configuration
-        self.config = AIConfig.load_config()
+        # Worker threads never touch Tk directly; they post (kind, args)
+        # messages here and the main loop applies them in _drain_ui_queue
+        self._ui_queue = queue.Queue()
+        
+        # Blocks held back by the row budget, keyed by the Text widget they belong to
+        self._hidden_blocks = {}
         
-        # AI service configuration
+        # (browse, analyze, execute) states last applied by _update_button_states
+        self._last_btn_state = (None, None, None)
+        
+        # AI service configuration; the service itself is created on first use (see ai_service)
         self.ai_provider = AIProvider.CLAUDE
-        self.ai_service = None  # Will be initialized when API key is provided
+        self._ai_service_instance = None
+        self._ai_service_lock = threading.Lock()  # AI batches may touch ai_service concurrently
         
         self.setup_gui()
+        self._ui_handlers = {
+            'status': self.status_var.set,
+            'scan_chunk': self._on_scan_chunk,
+            'analysis_done': self._on_analysis_done,
+            'analysis_empty': self._on_analysis_empty,
+            'analysis_failed': self._on_analysis_failed,
+            'plan': self._on_plan_ready,
+            'ai_fallback': self._on_ai_fallback,
+            'progress': self._on_execution_progress,
+            'execution_done': self._on_execution_done,
+            'execution_failed': self._on_execution_failed,
+        }
         self._initialize_ai_service()
+        self.root.after(self.UI_POLL_MS, self._drain_ui_queue)
     
     def setup_gui(self):
         """Set up the basic Tkinter GUI framework"""
@@ -1777,6 +2382,7 @@ class BuzzSortApp:
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Select Folder...", command=self.select_folder, accelerator="Ctrl+O")
+        file_menu.add_command(label="Test AI Connection", command=self.test_ai_connection)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
         
@@ -1957,6 +2563,16 @@ class BuzzSortApp:
         self.plan_text.tag_configure('file', foreground='#54585A')
         self.plan_text.tag_configure('arrow', foreground='#A4925A')
         
+        # Clickable "N more ... hidden" line appended when a report exceeds its row budget
+        for text_widget in (self.analysis_text, self.plan_text):
+            text_widget.tag_configure('expand_more', foreground='#003057', underline=True)
+            text_widget.tag_bind('expand_more', '<Button-1>',
+                                 lambda e, w=text_widget: self._expand_hidden_blocks(w))
+            text_widget.tag_bind('expand_more', '<Enter>',
+                                 lambda e, w=text_widget: w.config(cursor='hand2'))
+            text_widget.tag_bind('expand_more', '<Leave>',
+                                 lambda e, w=text_widget: w.config(cursor=''))
+        
         # Action buttons with better spacing and styling
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=6, column=0, columnspan=2, pady=(5, 10))
@@ -1979,7 +2595,12 @@ class BuzzSortApp:
                                 pady=(5, 10))
         self.progress_frame.columnconfigure(0, weight=1)
         
-        self.progress_label = ttk.Label(self.progress_frame, text="", 
+        # Progress is updated through Tk variables, which is cheaper than
+        # reconfiguring the label and bar on every tick
+        self.progress_text_var = tk.StringVar()
+        self.progress_value_var = tk.DoubleVar()
+        
+        self.progress_label = ttk.Label(self.progress_frame, textvariable=self.progress_text_var, 
                                        font=('Segoe UI', 10, 'bold'), foreground='#003057')
         self.progress_label.grid(row=0, column=0, sticky=tk.W, pady=(0, 8))
         
@@ -1993,6 +2614,7 @@ class BuzzSortApp:
         
         self.progress_bar = ttk.Progressbar(self.progress_frame, 
                                            mode='determinate',
+                                           variable=self.progress_value_var,
                                            style='Buzz.Horizontal.TProgressbar')
         self.progress_bar.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
@@ -2013,6 +2635,28 @@ class BuzzSortApp:
         """Create a tooltip for a widget"""
         ToolTip(widget, text)
     
+    def _post(self, kind: str, *args):
+        """
+        Queue a UI update from a worker thread
+        
+        Args:
+            kind: Message type, a key of self._ui_handlers
+            *args: Arguments passed to the handler on the Tk thread
+        """
+        self._ui_queue.put((kind, args))
+    
+    def _drain_ui_queue(self):
+        """Apply all pending worker messages to the widgets, then reschedule"""
+        try:
+            while True:
+                try:
+                    kind, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._ui_handlers[kind](*args)
+        finally:
+            self.root.after(self.UI_POLL_MS, self._drain_ui_queue)
+    
     def _insert_colored_text(self, text_widget, text, tag=None):
         """
         Insert text with optional color tag
@@ -2027,6 +2671,98 @@ class BuzzSortApp:
         else:
             text_widget.insert(tk.END, text)
     
+    def _render_text(self, text_widget, parts: List, clear: bool = True, hidden: Optional[Tuple] = None):
+        """
+        Write pre-formatted text into a read-only Text widget with a single insert
+        
+        Building the string in Python first keeps rendering to one Tcl call and
+        one relayout, however many lines the report has.
+        
+        Args:
+            text_widget: Text widget to write into
+            parts: Text fragments, or (text, tag) pairs for tagged runs, in order
+            clear: If True, replace the widget contents; otherwise append
+            hidden: Blocks held back by _take_blocks, loaded when the user expands them
+        """
+        if clear:
+            self._hidden_blocks.pop(text_widget, None)
+        if hidden:
+            self._hidden_blocks[text_widget] = hidden
+        
+        text_widget.config(state=tk.NORMAL)
+        if clear:
+            text_widget.delete(1.0, tk.END)
+        text_widget.insert(tk.END, *self._insert_args(parts))
+        text_widget.config(state=tk.DISABLED)
+    
+    def _insert_args(self, parts: List) -> List:
+        """
+        Coalesce text fragments into the chars/tags argument list of Text.insert
+        
+        Args:
+            parts: Text fragments, or (text, tag) pairs for tagged runs
+            
+        Returns:
+            Alternating chars and tag tuples; untagged neighbours are joined into one run
+        """
+        args = []
+        run = []
+        for part in parts:
+            if isinstance(part, tuple):
+                if run:
+                    args += ["".join(run), ()]
+                    run = []
+                args += [part[0], (part[1],)]
+            else:
+                run.append(part)
+        if run or not args:
+            args += ["".join(run), ()]
+        return args
+    
+    def _take_blocks(self, blocks: List[str], noun: str, budget: int) -> Tuple[List, Optional[Tuple]]:
+        """
+        Split report blocks into those rendered now and a tail loaded on demand
+        
+        Args:
+            blocks: Pre-formatted blocks (one folder, category, error...) in display order
+            noun: What a block is, for the "N more ... hidden" line
+            budget: Maximum rows to render; at least one block is always shown
+            
+        Returns:
+            Tuple of (parts to render, hidden tail for _render_text or None)
+        """
+        rows = 0
+        for i, block in enumerate(blocks):
+            rows += block.count('\n')
+            if rows > budget and i > 0:
+                tail = blocks[i:]
+                parts = blocks[:i]
+                parts.append((f"… {len(tail)} more {noun} hidden (click to expand)\n", 'expand_more'))
+                return parts, (tail, noun, budget)
+        return list(blocks), None
+    
+    def _expand_hidden_blocks(self, text_widget):
+        """
+        Replace the "click to expand" line with the next budget's worth of held-back blocks
+        
+        Args:
+            text_widget: Text widget whose sentinel line was clicked
+        """
+        hidden = self._hidden_blocks.pop(text_widget, None)
+        sentinel = text_widget.tag_ranges('expand_more')
+        if not hidden or not sentinel:
+            return
+        
+        blocks, noun, budget = hidden
+        parts, hidden = self._take_blocks(blocks, noun, budget)
+        if hidden:
+            self._hidden_blocks[text_widget] = hidden
+        
+        text_widget.config(state=tk.NORMAL)
+        text_widget.delete(sentinel[0], sentinel[1])
+        text_widget.insert(sentinel[0], *self._insert_args(parts))
+        text_widget.config(state=tk.DISABLED)
+    
     def _display_filter_options(self):
         """Display filtering options based on date suggestions and file counts"""
         # Clear existing filter buttons
@@ -2145,9 +2881,8 @@ class BuzzSortApp:
         self.filter_frame.grid_remove()
         
         # Perform AI-based filename analysis if service is available
-        if self.ai_service and len(self.filtered_files) > 0:
+        if self._ai_available() and len(self.filtered_files) > 0:
             self.status_var.set(f"🤖 Running AI analysis on {len(self.filtered_files)} files...")
-            self.root.update()
             self.perform_ai_filename_analysis()
         else:
             # No AI service, use basic organization
@@ -2163,15 +2898,22 @@ class BuzzSortApp:
             executing: True if execution is in progress
         """
         if analyzing or executing:
-            self.browse_button.config(state=tk.DISABLED)
-            self.analyze_button.config(state=tk.DISABLED)
-            self.execute_button.config(state=tk.DISABLED)
+            desired = (tk.DISABLED, tk.DISABLED, tk.DISABLED)
             self.is_processing = True
         else:
-            self.browse_button.config(state=tk.NORMAL)
-            self.analyze_button.config(state=tk.NORMAL if self.selected_folder else tk.DISABLED)
-            self.execute_button.config(state=tk.NORMAL if self.current_plan and not self.current_plan.get('error') else tk.DISABLED)
+            desired = (
+                tk.NORMAL,
+                tk.NORMAL if self.selected_folder else tk.DISABLED,
+                tk.NORMAL if self.current_plan and not self.current_plan.get('error') else tk.DISABLED
+            )
             self.is_processing = False
+        
+        # Only reconfigure buttons whose state actually changes
+        buttons = (self.browse_button, self.analyze_button, self.execute_button)
+        for button, state, previous in zip(buttons, desired, self._last_btn_state):
+            if state != previous:
+                button.config(state=state)
+        self._last_btn_state = desired
     
     def select_folder(self):
         """Handle folder selection"""
@@ -2181,9 +2923,10 @@ class BuzzSortApp:
         folder = filedialog.askdirectory(title="Select folder to organize")
         if folder:
             self.selected_folder = folder
+            self._folder_basename = os.path.basename(folder)
             self.folder_label.config(text=folder, foreground="#1976d2", font=('Arial', 9, 'bold'))
             self._update_button_states()
-            self.status_var.set(f"✓ Folder selected: {os.path.basename(folder)}")
+            self.status_var.set(f"✓ Folder selected: {self._folder_basename}")
             
             # Clear previous results
             self.clear_display_areas()
@@ -2220,34 +2963,65 @@ class BuzzSortApp:
         # Update button states to disabled during analysis
         self._update_button_states(analyzing=True)
         
-        self.status_var.set("⏳ Scanning files...")
-        self.root.update()  # Update GUI to show status
+        self.status_var.set(f"⏳ Scanning {self._folder_basename}...")
+        self._render_text(self.analysis_text, [f"SCANNING {self.selected_folder}\n"])
         
+        # Scan on a worker thread so the window stays responsive
+        threading.Thread(target=self._analyze_worker, args=(self.selected_folder,), daemon=True).start()
+    
+    def _analyze_worker(self, folder: str):
+        """
+        Scan the folder and compute statistics off the Tk thread
+        
+        Args:
+            folder: Directory to scan
+        """
         try:
-            # Scan the directory
-            self.scanned_files = self.scanner.scan_directory(self.selected_folder)
+            # Scan the directory, folding each batch into the statistics and
+            # reporting progress while the walk continues
+            file_type_stats = {}
+            
+            def on_chunk(batch: List[Dict]):
+                self.scanner.update_file_type_stats(file_type_stats, batch)
+                scanned = sum(stats['count'] for stats in file_type_stats.values())
+                size_mb = sum(stats['total_size_mb'] for stats in file_type_stats.values())
+                self._post('scan_chunk', scanned, size_mb)
+            
+            files = self.scanner.scan_directory(folder, chunk_callback=on_chunk)
             
             # Log the scan operation
             errors = self.scanner.get_scan_errors()
-            self.logger.log_scan(self.selected_folder, len(self.scanned_files), errors)
+            self.logger.log_scan(folder, len(files), errors)
             
-            if not self.scanned_files:
-                self.status_var.set("⚠ No files found in selected folder")
-                self._update_button_states()
-                messagebox.showinfo("No Files", "No files were found in the selected folder.")
+            if not files:
+                self._post('analysis_empty')
                 return
             
-            self.status_var.set(f"⏳ Analyzing {len(self.scanned_files)} files...")
-            self.root.update()
-            
-            # Get detailed file type statistics
-            file_type_stats = self.scanner.get_file_type_stats(self.scanned_files)
+            self._post('status', f"⏳ Analyzing {len(files)} files...")
             
             # Get date-based filtering suggestions
-            self.date_suggestions = self.scanner.get_date_based_suggestions(self.scanned_files)
+            date_suggestions = self.scanner.get_date_based_suggestions(files)
+            
+            self._post('analysis_done', files, file_type_stats, date_suggestions, errors)
             
+        except Exception as e:
+            self.logger.log_error('scan', str(e))
+            self._post('analysis_failed', str(e))
+    
+    def _on_scan_chunk(self, scanned: int, size_mb: float):
+        """Report the running totals of a scan that is still in progress"""
+        self.status_var.set(f"⏳ Scanning {self._folder_basename}... {scanned:,} files found")
+        self._render_text(self.analysis_text, [f"   {scanned:,} files, {size_mb:.1f} MB so far\n"], clear=False)
+    
+    def _on_analysis_done(self, files: List[Dict], file_type_stats: Dict[str, Dict],
+                          date_suggestions: List[Dict], errors: List[str]):
+        """Display the results of a finished scan"""
+        self.scanned_files = files
+        self.date_suggestions = date_suggestions
+        
+        try:
             # Display results
-            self.display_analysis_results(file_type_stats, self.date_suggestions)
+            self.display_analysis_results(file_type_stats, date_suggestions)
             
             # Check for errors
             if errors:
@@ -2257,53 +3031,77 @@ class BuzzSortApp:
             # Show filtering options
             self._display_filter_options()
             
-            self.status_var.set(f"✓ Analysis complete - Found {len(self.scanned_files)} files - Select files to organize")
+            self.status_var.set(f"✓ Analysis complete - Found {len(files)} files - Select files to organize")
             
         except Exception as e:
             self.logger.log_error('scan', str(e))
-            messagebox.showerror("Scan Error", f"An error occurred during scanning:\n\n{str(e)}")
             self.status_var.set("❌ Scan failed")
+            self.root.after_idle(messagebox.showerror, "Scan Error", f"An error occurred during scanning:\n\n{str(e)}")
         finally:
             # Re-enable buttons
             self._update_button_states()
     
+    def _on_analysis_empty(self):
+        """Handle a scan that found no files"""
+        self.scanned_files = []
+        self.status_var.set("⚠ No files found in selected folder")
+        self._update_button_states()
+        self.root.after_idle(messagebox.showinfo, "No Files", "No files were found in the selected folder.")
+    
+    def _on_analysis_failed(self, error: str):
+        """Handle an exception raised by the scan worker"""
+        self.status_var.set("❌ Scan failed")
+        self._update_button_states()
+        self.root.after_idle(messagebox.showerror, "Scan Error", f"An error occurred during scanning:\n\n{error}")
+    
     def perform_ai_filename_analysis(self):
-        """Perform AI-based filename clustering analysis"""
+        """Start AI-based filename clustering on a worker thread"""
+        # Use filtered files if available, otherwise use all scanned files
+        files_to_process = self.filtered_files if self.filtered_files else self.scanned_files
+        
+        self._update_button_states(analyzing=True)
+        threading.Thread(target=self._ai_analysis_worker, args=(files_to_process,), daemon=True).start()
+    
+    def _ai_analysis_worker(self, files_to_process: List[Dict]):
+        """
+        Cluster filenames with the AI service and build a plan off the Tk thread
+        
+        Args:
+            files_to_process: File information dictionaries to organize
+        """
         try:
-            # Use filtered files if available, otherwise use all scanned files
-            files_to_process = self.filtered_files if self.filtered_files else self.scanned_files
-            
             # Handle large batches by subdividing
-            if len(files_to_process) > 100:
-                # Process in batches of 100
-                self.status_var.set(f"🤖 Processing {len(files_to_process)} files in batches...")
-                self.root.update()
+            if len(files_to_process) > self.AI_BATCH_SIZE:
+                # Analyze batches concurrently; the requests are network-bound
+                self._post('status', f"🤖 Processing {len(files_to_process)} files in batches...")
                 
-                all_clusters = []
-                batch_size = 100
-                num_batches = (len(files_to_process) + batch_size - 1) // batch_size
+                batch_size = self.AI_BATCH_SIZE
+                batches = [files_to_process[i:i + batch_size] for i in range(0, len(files_to_process), batch_size)]
+                num_batches = len(batches)
+                batch_clusters = [None] * num_batches  # Kept in batch order for a deterministic merge
                 
-                for batch_num in range(num_batches):
-                    start_idx = batch_num * batch_size
-                    end_idx = min(start_idx + batch_size, len(files_to_process))
-                    batch_files = files_to_process[start_idx:end_idx]
-                    
-                    self.status_var.set(f"🤖 Analyzing batch {batch_num + 1}/{num_batches} ({len(batch_files)} files)...")
-                    self.root.update()
-                    
-                    filenames_to_analyze = [f['name'] for f in batch_files]
-                    result = self.ai_service.analyze_filenames(filenames_to_analyze)
+                with ThreadPoolExecutor(max_workers=self.AI_MAX_WORKERS) as pool:
+                    futures = {
+                        pool.submit(self._analyze_filenames_cached, [f['name'] for f in batch]): batch_num
+                        for batch_num, batch in enumerate(batches)
+                    }
                     
-                    if not result.get('error') and result.get('clusters'):
-                        # Add batch prefix to folder names to avoid conflicts
-                        for cluster in result['clusters']:
-                            cluster['suggested_folder'] = f"batch{batch_num + 1}_{cluster.get('suggested_folder', 'files')}"
-                        all_clusters.extend(result['clusters'])
-                    else:
-                        # If a batch fails, fall back to basic organization for that batch
-                        self.status_var.set(f"⚠ Batch {batch_num + 1} failed - Using basic organization")
-                        basic_result = self._create_basic_clusters(batch_files, batch_prefix=f"batch{batch_num + 1}_")
-                        all_clusters.extend(basic_result['clusters'])
+                    for completed, future in enumerate(as_completed(futures), 1):
+                        batch_num = futures[future]
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            result = {'error': str(e)}
+                        
+                        if not result.get('error') and result.get('clusters'):
+                            batch_clusters[batch_num] = result['clusters']
+                            self._post('status', f"🤖 Analyzed {completed}/{num_batches} batches...")
+                        else:
+                            # If a batch fails, fall back to basic organization for that batch
+                            self._post('status', f"⚠ Batch {batch_num + 1} failed - Using basic organization")
+                            batch_clusters[batch_num] = self._create_basic_clusters(batches[batch_num])['clusters']
+                
+                all_clusters = self._merge_clusters(batch_clusters)
                 
                 # Create combined result
                 combined_result = {
@@ -2312,66 +3110,120 @@ class BuzzSortApp:
                     'error': None
                 }
                 
-                self.status_var.set("📋 Creating organization plan...")
-                self.root.update()
+                self._post('status', "📋 Creating organization plan...")
                 
-                self.current_plan = self.planner.create_plan(files_to_process, combined_result)
-                self.display_organization_plan(self.current_plan)
-                self._update_button_states()
+                self._post('plan', self.planner.create_plan(files_to_process, combined_result))
                 
             else:
                 # Process normally for smaller batches
                 filenames_to_analyze = [f['name'] for f in files_to_process]
                 
-                self.status_var.set(f"🤖 Analyzing {len(files_to_process)} files...")
-                self.root.update()
+                self._post('status', f"🤖 Analyzing {len(files_to_process)} files...")
                 
                 # Call AI service
-                result = self.ai_service.analyze_filenames(filenames_to_analyze)
+                result = self._analyze_filenames_cached(filenames_to_analyze)
                 
                 # Create organization plan based on AI analysis
                 if not result.get('error') and result.get('clusters'):
                     # Log successful AI analysis
                     self.logger.log_ai_analysis(len(files_to_process), len(result.get('clusters', [])), success=True)
                     
-                    self.status_var.set("📋 Creating organization plan...")
-                    self.root.update()
+                    self._post('status', "📋 Creating organization plan...")
                     
-                    self.current_plan = self.planner.create_plan(files_to_process, result)
+                    plan = self.planner.create_plan(files_to_process, result)
                     
                     # Log plan creation
-                    if self.current_plan and not self.current_plan.get('error'):
+                    if plan and not plan.get('error'):
                         self.logger.log_plan_creation(
-                            len(self.current_plan.get('folders_to_create', [])),
-                            len(self.current_plan.get('file_operations', [])),
+                            len(plan.get('folders_to_create', [])),
+                            len(plan.get('file_operations', [])),
                             success=True
                         )
                     
                     # Display the plan
-                    self.display_organization_plan(self.current_plan)
-                    
-                    # Update button states
-                    self._update_button_states()
+                    self._post('plan', plan)
                 else:
                     # AI analysis failed - fall back to basic organization
                     self.logger.log_ai_analysis(len(files_to_process), 0, success=False, error=result.get('error', 'Unknown error'))
-                    self.status_var.set("⚠ AI analysis failed - Using basic organization")
-                    self._fallback_to_basic_organization(files_to_process, result.get('error', 'Unknown error'))
+                    self._post('ai_fallback', files_to_process, result.get('error', 'Unknown error'))
             
         except Exception as e:
             # Handle unexpected errors with fallback
-            error_msg = f"AI Analysis Error: {str(e)}"
-            self.status_var.set("⚠ AI analysis failed - Using basic organization")
-            files_to_process = self.filtered_files if self.filtered_files else self.scanned_files
-            self._fallback_to_basic_organization(files_to_process, error_msg)
+            self._post('ai_fallback', files_to_process, f"AI Analysis Error: {str(e)}")
     
-    def _create_basic_clusters(self, files: List[Dict], batch_prefix: str = "") -> Dict:
+    def _analyze_filenames_cached(self, filenames: List[str]) -> Dict:
+        """
+        Cluster filenames with the AI service, reusing the result for a filename set seen before
+        
+        Args:
+            filenames: Filenames to analyze
+            
+        Returns:
+            Analysis result in the format of AIServiceInterface.analyze_filenames
+        """
+        if self.scan_cache:
+            cached = self.scan_cache.get_clusters(filenames)
+            if cached:
+                return cached
+        
+        result = self.ai_service.analyze_filenames(filenames)
+        
+        # Stored as JSON right away, so later edits to the clusters don't leak into the cache
+        if self.scan_cache and not result.get('error') and result.get('clusters'):
+            self.scan_cache.store_clusters(filenames, result)
+        return result
+    
+    def _on_plan_ready(self, plan: Dict):
+        """Show a plan produced by the AI analysis worker"""
+        self.current_plan = plan
+        try:
+            self.display_organization_plan(plan)
+        except Exception as e:
+            self.logger.log_error('plan_display', str(e))
+            self.status_var.set("❌ Could not display the organization plan")
+            self.root.after_idle(messagebox.showerror, "Plan Error",
+                                 f"An error occurred while displaying the plan:\n\n{str(e)}")
+        finally:
+            self._update_button_states()
+    
+    def _on_ai_fallback(self, files: List[Dict], error_message: str):
+        """Switch to basic organization after the AI analysis worker failed"""
+        self.status_var.set("⚠ AI analysis failed - Using basic organization")
+        self._fallback_to_basic_organization(files, error_message)
+        self._update_button_states()
+    
+    def _merge_clusters(self, batch_clusters: List[List[Dict]]) -> List[Dict]:
+        """
+        Combine clusters from separately analyzed batches into one cluster per category
+        
+        Args:
+            batch_clusters: Cluster lists in batch order
+            
+        Returns:
+            Merged clusters; the first batch to name a category decides its folder
+        """
+        merged = {}
+        for clusters in batch_clusters:
+            for cluster in clusters:
+                category = cluster.get('category', 'Uncategorized')
+                target = merged.get(category)
+                if target is None:
+                    merged[category] = {**cluster, 'files': list(cluster.get('files', []))}
+                    continue
+                
+                target['files'].extend(cluster.get('files', []))
+                description = cluster.get('description')
+                if description and description not in target.get('description', ''):
+                    target['description'] = f"{target['description']}; {description}" if target.get('description') else description
+        
+        return list(merged.values())
+    
+    def _create_basic_clusters(self, files: List[Dict]) -> Dict:
         """
         Create basic file type clusters
         
         Args:
             files: List of file information dictionaries
-            batch_prefix: Optional prefix for folder names
             
         Returns:
             Dictionary with cluster information
@@ -2397,7 +3249,7 @@ class BuzzSortApp:
                     'category': type_names.get(file_type, 'Other Files'),
                     'files': file_list,
                     'description': f'Files organized by type: {file_type}',
-                    'suggested_folder': f"{batch_prefix}{file_type}"
+                    'suggested_folder': file_type
                 })
         
         return {
@@ -2422,17 +3274,17 @@ class BuzzSortApp:
             self.current_plan = self.planner.create_plan(files, basic_result)
             
             # Display the plan with warning
-            self.plan_text.config(state=tk.NORMAL)
-            self.plan_text.delete(1.0, tk.END)
-            
-            self.plan_text.insert(tk.END, "⚠️ BASIC ORGANIZATION MODE\n")
-            self.plan_text.insert(tk.END, "="*60 + "\n\n")
-            self.plan_text.insert(tk.END, f"AI Analysis Error: {error_message}\n\n")
-            self.plan_text.insert(tk.END, "Falling back to basic file type organization.\n")
-            self.plan_text.insert(tk.END, "Files will be organized by type (documents, images, videos, other).\n\n")
-            self.plan_text.insert(tk.END, "="*60 + "\n\n")
-            
-            self.plan_text.config(state=tk.DISABLED)
+            parts = []
+            parts.append(("⚠️ BASIC ORGANIZATION MODE\n", 'header'))
+            parts.append(_SEP60)
+            parts.append("\n")
+            parts.append(f"AI Analysis Error: {error_message}\n\n")
+            parts.append("Falling back to basic file type organization.\n")
+            parts.append("Files will be organized by type (documents, images, videos, other).\n\n")
+            parts.append(_SEP60)
+            parts.append("\n")
+            
+            self._render_text(self.plan_text, parts)
             
             # Display the basic plan
             self.display_organization_plan(self.current_plan)
@@ -2442,15 +3294,15 @@ class BuzzSortApp:
             
         except Exception as e:
             # If even basic organization fails, show error
-            self.plan_text.config(state=tk.NORMAL)
-            self.plan_text.delete(1.0, tk.END)
-            self.plan_text.insert(tk.END, f"❌ ORGANIZATION FAILED\n")
-            self.plan_text.insert(tk.END, "="*60 + "\n\n")
-            self.plan_text.insert(tk.END, f"AI Error: {error_message}\n")
-            self.plan_text.insert(tk.END, f"Fallback Error: {str(e)}\n\n")
-            self.plan_text.insert(tk.END, "Unable to create organization plan.\n")
-            self.plan_text.insert(tk.END, "Please check your files and try again.\n")
-            self.plan_text.config(state=tk.DISABLED)
+            parts = []
+            parts.append(("❌ ORGANIZATION FAILED\n", 'header'))
+            parts.append(_SEP60)
+            parts.append("\n")
+            parts.append(f"AI Error: {error_message}\n")
+            parts.append(f"Fallback Error: {str(e)}\n\n")
+            parts.append("Unable to create organization plan.\n")
+            parts.append("Please check your files and try again.\n")
+            self._render_text(self.plan_text, parts)
             self.status_var.set("❌ Organization failed")
     
     def perform_content_analysis(self, file_info: Dict) -> Dict:
@@ -2512,208 +3364,224 @@ class BuzzSortApp:
         Args:
             plan: Organization plan dictionary from OrganizationPlanner
         """
-        self.plan_text.config(state=tk.NORMAL)
-        self.plan_text.delete(1.0, tk.END)
+        parts = []
+        hidden = None
         
         if plan.get('error'):
-            self.plan_text.insert(tk.END, f"ORGANIZATION PLAN ERROR\n")
-            self.plan_text.insert(tk.END, f"{'='*60}\n\n")
-            self.plan_text.insert(tk.END, f"Error: {plan['error']}\n")
-            self.plan_text.insert(tk.END, f"\n{plan.get('summary', '')}\n")
+            parts.append(("ORGANIZATION PLAN ERROR\n", 'header'))
+            parts.append(_SEP60)
+            parts.append("\n")
+            parts.append(f"Error: {plan['error']}\n")
+            parts.append(f"\n{plan.get('summary', '')}\n")
         else:
             # Display header
-            self.plan_text.insert(tk.END, f"FILE ORGANIZATION PLAN\n")
-            self.plan_text.insert(tk.END, f"{'='*60}\n\n")
+            parts.append(("FILE ORGANIZATION PLAN\n", 'header'))
+            parts.append(_SEP60)
+            parts.append("\n")
             
             # Display summary
             summary = plan.get('summary', '')
-            self.plan_text.insert(tk.END, f"{summary}\n\n")
+            parts.append(f"{summary}\n\n")
             
             # Display folder structure
             folders = plan.get('folders_to_create', [])
             if folders:
-                self.plan_text.insert(tk.END, f"FOLDERS TO CREATE:\n")
-                self.plan_text.insert(tk.END, f"{'-'*40}\n")
+                parts.append(("FOLDERS TO CREATE:\n", 'subheader'))
+                parts.append(_RULE40)
                 for folder in folders:
-                    self.plan_text.insert(tk.END, f"📁 {folder}/\n")
-                self.plan_text.insert(tk.END, "\n")
+                    parts.append(f"📁 {folder}/\n")
+                parts.append("\n")
             
             # Display file operations grouped by destination folder
             operations = plan.get('file_operations', [])
             if operations:
-                self.plan_text.insert(tk.END, f"FILE OPERATIONS:\n")
-                self.plan_text.insert(tk.END, f"{'-'*40}\n\n")
+                parts.append(("FILE OPERATIONS:\n", 'subheader'))
+                parts.append(_RULE40)
+                parts.append("\n")
                 
-                # Group operations by destination folder
-                ops_by_folder = defaultdict(list)
-                for op in operations:
-                    dest_folder = op.get('destination_folder', 'root')
-                    ops_by_folder[dest_folder].append(op)
+                # Operations are grouped by destination folder when the plan is created
+                ops_by_folder = plan.get('ops_by_folder') or self.planner.group_operations_by_folder(
+                    operations, plan.get('folders_to_create'))
                 
-                # Display operations for each folder
-                for folder, folder_ops in sorted(ops_by_folder.items()):
+                # Format one block per folder; only RENDER_ROW_BUDGET rows go into the
+                # widget now, the rest stay behind a "click to expand" line
+                folder_blocks = []
+                for folder, folder_ops in ops_by_folder.items():
                     category = folder_ops[0].get('category', 'Files') if folder_ops else 'Files'
-                    self.plan_text.insert(tk.END, f"📁 {folder}/ ({len(folder_ops)} files)\n")
-                    self.plan_text.insert(tk.END, f"   Category: {category}\n\n")
+                    block = [f"📁 {folder}/ ({len(folder_ops)} files)\n"]
+                    block.append(f"   Category: {category}\n\n")
                     
                     # Show first 10 operations for this folder
                     display_count = min(10, len(folder_ops))
-                    for op in folder_ops[:display_count]:
+                    for op in islice(folder_ops, display_count):
                         original_name = op.get('original_name', 'unknown')
                         new_name = op.get('new_name', original_name)
                         action = op.get('action', 'move')
                         
                         # Determine the operation symbol
                         if action == 'move_and_rename' or (new_name != original_name):
-                            self.plan_text.insert(tk.END, f"   📄 {original_name}\n")
-                            self.plan_text.insert(tk.END, f"      → Rename to: {new_name}\n")
+                            block.append(f"   📄 {original_name}\n")
+                            block.append(f"      → Rename to: {new_name}\n")
                             if op.get('conflict_resolved'):
-                                self.plan_text.insert(tk.END, f"      ⚠️  Conflict resolved\n")
+                                block.append(f"      ⚠️  Conflict resolved\n")
                         else:
-                            self.plan_text.insert(tk.END, f"   📄 {original_name}\n")
+                            block.append(f"   📄 {original_name}\n")
                     
                     if len(folder_ops) > display_count:
-                        self.plan_text.insert(tk.END, f"   ... and {len(folder_ops) - display_count} more files\n")
+                        block.append(f"   ... and {len(folder_ops) - display_count} more files\n")
                     
-                    self.plan_text.insert(tk.END, "\n")
+                    block.append("\n")
+                    folder_blocks.append("".join(block))
+                
+                shown, hidden = self._take_blocks(folder_blocks, 'folders', self.RENDER_ROW_BUDGET)
+                parts.extend(shown)
             
             # Display action prompt
-            self.plan_text.insert(tk.END, f"{'='*60}\n")
-            self.plan_text.insert(tk.END, f"💡 Review the plan above and click 'Execute Plan' to proceed.\n")
-            self.plan_text.insert(tk.END, f"⚠️  WARNING: File operations cannot be undone!\n")
+            parts.append(_SEP60)
+            parts.append(f"💡 Review the plan above and click 'Execute Plan' to proceed.\n")
+            parts.append(f"⚠️  WARNING: File operations cannot be undone!\n")
         
-        self.plan_text.config(state=tk.DISABLED)
+        self._render_text(self.plan_text, parts, hidden=hidden)
     
     def display_ai_clusters(self, result: Dict):
         """Display AI clustering results in the plan text area"""
-        self.plan_text.config(state=tk.NORMAL)
-        self.plan_text.delete(1.0, tk.END)
+        parts = []
+        hidden = None
         
         if result.get('error'):
-            self.plan_text.insert(tk.END, f"AI ANALYSIS ERROR\n")
-            self.plan_text.insert(tk.END, f"{'='*60}\n\n")
-            self.plan_text.insert(tk.END, f"Error: {result['error']}\n")
+            parts.append(("AI ANALYSIS ERROR\n", 'header'))
+            parts.append(_SEP60)
+            parts.append("\n")
+            parts.append(f"Error: {result['error']}\n")
             
             if result.get('raw_response'):
-                self.plan_text.insert(tk.END, f"\nRaw response:\n{result['raw_response'][:500]}\n")
+                parts.append(f"\nRaw response:\n{result['raw_response'][:500]}\n")
         else:
             clusters = result.get('clusters', [])
             total_files = result.get('total_files', 0)
             
-            self.plan_text.insert(tk.END, f"AI-POWERED FILE ORGANIZATION PLAN\n")
-            self.plan_text.insert(tk.END, f"{'='*60}\n\n")
-            self.plan_text.insert(tk.END, f"Analyzed {total_files} files and identified {len(clusters)} categories:\n\n")
+            parts.append(("AI-POWERED FILE ORGANIZATION PLAN\n", 'header'))
+            parts.append(_SEP60)
+            parts.append("\n")
+            parts.append(f"Analyzed {total_files} files and identified {len(clusters)} categories:\n\n")
             
+            cluster_blocks = []
             for i, cluster in enumerate(clusters, 1):
                 category = cluster.get('category', 'Unknown')
                 files = cluster.get('files', [])
                 description = cluster.get('description', 'No description')
                 suggested_folder = cluster.get('suggested_folder', category.lower().replace(' ', '_'))
                 
-                self.plan_text.insert(tk.END, f"📁 Category {i}: {category}\n")
-                self.plan_text.insert(tk.END, f"   Suggested folder: {suggested_folder}/\n")
-                self.plan_text.insert(tk.END, f"   Files: {len(files)}\n")
-                self.plan_text.insert(tk.END, f"   Description: {description}\n")
+                block = [f"📁 Category {i}: {category}\n"]
+                block.append(f"   Suggested folder: {suggested_folder}/\n")
+                block.append(f"   Files: {len(files)}\n")
+                block.append(f"   Description: {description}\n")
                 
                 # Show first few files as examples
                 example_count = min(5, len(files))
                 if example_count > 0:
-                    self.plan_text.insert(tk.END, f"   Examples:\n")
-                    for file in files[:example_count]:
-                        self.plan_text.insert(tk.END, f"      • {file}\n")
+                    block.append(f"   Examples:\n")
+                    for file in islice(files, example_count):
+                        block.append(f"      • {file}\n")
                     
                     if len(files) > example_count:
-                        self.plan_text.insert(tk.END, f"      ... and {len(files) - example_count} more\n")
+                        block.append(f"      ... and {len(files) - example_count} more\n")
                 
-                self.plan_text.insert(tk.END, "\n")
+                block.append("\n")
+                cluster_blocks.append("".join(block))
+            
+            shown, hidden = self._take_blocks(cluster_blocks, 'categories', self.RENDER_ROW_BUDGET)
+            parts.extend(shown)
             
-            self.plan_text.insert(tk.END, f"\n💡 TIP: Review these suggestions and use 'Execute Plan' to organize files.\n")
+            parts.append(f"\n💡 TIP: Review these suggestions and use 'Execute Plan' to organize files.\n")
         
-        self.plan_text.config(state=tk.DISABLED)
+        self._render_text(self.plan_text, parts, hidden=hidden)
     
     def display_analysis_results(self, file_type_stats: Dict[str, Dict], date_suggestions: List[Dict]):
         """Display the enhanced analysis results in the analysis text area"""
-        self.analysis_text.config(state=tk.NORMAL)
-        self.analysis_text.delete(1.0, tk.END)
-        
-        # Summary
-        total_files = sum(stats['count'] for stats in file_type_stats.values())
-        total_size_mb = sum(stats['total_size_mb'] for stats in file_type_stats.values())
-        
-        self.analysis_text.insert(tk.END, f"FILE ANALYSIS RESULTS\n")
-        self.analysis_text.insert(tk.END, f"{'='*60}\n\n")
-        self.analysis_text.insert(tk.END, f"Total files found: {total_files:,}\n")
-        self.analysis_text.insert(tk.END, f"Total size: {total_size_mb:.1f} MB\n\n")
+        parts = []
+        
+        # Summary totals and the non-empty types, in a single pass over the stats
+        total_files = 0
+        total_size_mb = 0.0
+        present_types = []
+        for file_type, stats in file_type_stats.items():
+            if stats['count']:
+                total_files += stats['count']
+                total_size_mb += stats['total_size_mb']
+                present_types.append((file_type, stats))
+        
+        parts.append(("FILE ANALYSIS RESULTS\n", 'header'))
+        parts.append(_SEP60)
+        parts.append("\n")
+        parts.append(f"Total files found: {_fmt_int(total_files)}\n")
+        parts.append(f"Total size: {_fmt_mb(total_size_mb)} MB\n\n")
         
         # Enhanced file type breakdown
-        self.analysis_text.insert(tk.END, "FILE TYPE BREAKDOWN:\n")
-        self.analysis_text.insert(tk.END, f"{'-'*40}\n")
+        parts.append(("FILE TYPE BREAKDOWN:\n", 'subheader'))
+        parts.append(_RULE40)
         
         # Sort file types by count (descending)
-        sorted_types = sorted(file_type_stats.items(), key=lambda x: x[1]['count'], reverse=True)
+        present_types.sort(key=lambda x: x[1]['count'], reverse=True)
         
-        for file_type, stats in sorted_types:
-            if stats['count'] == 0:
-                continue
-                
+        for file_type, stats in present_types:
             count = stats['count']
             size_mb = stats['total_size_mb']
             percentage = (count / total_files) * 100 if total_files > 0 else 0
             
-            self.analysis_text.insert(tk.END, f"\n📁 {file_type.upper()}: {count:,} files ({percentage:.1f}%)\n")
-            self.analysis_text.insert(tk.END, f"   Size: {size_mb:.1f} MB\n")
+            parts.append(f"\n📁 {file_type.upper()}: {_fmt_int(count)} files ({_fmt_pct(percentage)}%)\n")
+            parts.append(f"   Size: {_fmt_mb(size_mb)} MB\n")
             
             # Show common extensions
             if stats['common_extensions']:
                 ext_text = ", ".join([f"{ext} ({cnt})" for ext, cnt in stats['common_extensions']])
-                self.analysis_text.insert(tk.END, f"   Common types: {ext_text}\n")
+                parts.append(f"   Common types: {ext_text}\n")
             
             # Show example files (up to 3)
-            examples = stats['files'][:3]
-            for file_info in examples:
+            for file_info in islice(stats['files'], 3):
                 file_size_mb = file_info['size'] / (1024 * 1024)
-                self.analysis_text.insert(tk.END, f"   • {file_info['name']} ({file_size_mb:.2f} MB)\n")
+                parts.append(f"   • {file_info['name']} ({file_size_mb:.2f} MB)\n")
             
-            if len(stats['files']) > 3:
-                self.analysis_text.insert(tk.END, f"   ... and {len(stats['files']) - 3} more files\n")
+            if count > 3:
+                parts.append(f"   ... and {count - 3} more files\n")
         
         # Date-based filtering suggestions
         if date_suggestions:
-            self.analysis_text.insert(tk.END, f"\n\nSMART ORGANIZATION SUGGESTIONS:\n")
-            self.analysis_text.insert(tk.END, f"{'-'*40}\n")
-            self.analysis_text.insert(tk.END, "Based on file dates, consider organizing in these batches:\n\n")
+            parts.append("\n\n")
+            parts.append(("SMART ORGANIZATION SUGGESTIONS:\n", 'subheader'))
+            parts.append(_RULE40)
+            parts.append("Based on file dates, consider organizing in these batches:\n\n")
             
             for i, suggestion in enumerate(date_suggestions, 1):
                 priority_icon = "🔥" if suggestion['priority'] == 'high' else "⭐" if suggestion['priority'] == 'medium' else "📋"
                 
-                self.analysis_text.insert(tk.END, f"{priority_icon} {suggestion['title']}\n")
-                self.analysis_text.insert(tk.END, f"   {suggestion['description']}\n")
+                parts.append(f"{priority_icon} {suggestion['title']}\n")
+                parts.append(f"   {suggestion['description']}\n")
                 
                 if suggestion['priority'] == 'high':
-                    self.analysis_text.insert(tk.END, f"   💡 Recommended: Good size for AI analysis\n")
+                    parts.append(f"   💡 Recommended: Good size for AI analysis\n")
                 elif suggestion['file_count'] > 200:
-                    self.analysis_text.insert(tk.END, f"   ⚠️  Large batch - consider smaller groups for better results\n")
+                    parts.append(f"   ⚠️  Large batch - consider smaller groups for better results\n")
                 
-                self.analysis_text.insert(tk.END, "\n")
+                parts.append("\n")
         
-        self.analysis_text.config(state=tk.DISABLED)
+        self._render_text(self.analysis_text, parts)
     
     def display_scan_errors(self, errors: List[str]):
         """Display scan errors to the user"""
         if not errors:
             return
         
-        self.analysis_text.config(state=tk.NORMAL)
-        self.analysis_text.insert(tk.END, f"\nSCAN WARNINGS/ERRORS:\n")
-        self.analysis_text.insert(tk.END, f"{'-'*30}\n")
-        
-        for error in errors[:10]:  # Show up to 10 errors
-            self.analysis_text.insert(tk.END, f"⚠ {error}\n")
+        parts = []
+        parts.append("\n")
+        parts.append(("SCAN WARNINGS/ERRORS:\n", 'subheader'))
+        parts.append(_RULE30)
         
-        if len(errors) > 10:
-            self.analysis_text.insert(tk.END, f"... and {len(errors) - 10} more errors\n")
+        shown, hidden = self._take_blocks([f"⚠ {error}\n" for error in errors],
+                                          'errors', self.SCAN_ERROR_ROWS)
+        parts.extend(shown)
         
-        self.analysis_text.config(state=tk.DISABLED)
+        self._render_text(self.analysis_text, parts, clear=False, hidden=hidden)
     
     def execute_plan(self):
         """Execute the organization plan with safety confirmations"""
@@ -2763,37 +3631,64 @@ class BuzzSortApp:
         
         # Show progress bar
         self.progress_frame.grid()
-        self.progress_label.config(text="⏳ Executing plan...")
-        self.progress_bar['value'] = 0
+        self.progress_text_var.set("⏳ Executing plan...")
+        self.progress_value_var.set(0)
         self.progress_bar['maximum'] = file_count + folder_count
-        self.root.update_idletasks()
         
-        # Define progress callback to update progress bar
-        def update_progress(current, total):
-            self.progress_bar['value'] = current
-            percentage = int((current / total) * 100) if total > 0 else 0
-            self.progress_label.config(text=f"⏳ Executing plan... {percentage}% ({current}/{total})")
-            self.root.update_idletasks()
+        self.status_var.set("⏳ Executing file operations...")
+        
+        # Move files on a worker thread; progress comes back through the UI queue
+        threading.Thread(
+            target=self._execute_worker,
+            args=(self.current_plan, self.selected_folder),
+            daemon=True
+        ).start()
+    
+    def _execute_worker(self, plan: Dict, folder: str):
+        """
+        Execute the plan off the Tk thread
+        
+        Args:
+            plan: Organization plan to execute
+            folder: Base directory for the plan
+        """
+        last_post = [0.0]
+        
+        def report_progress(current: int, total: int):
+            # The bar can't redraw faster than ~30 Hz, so drop intermediate
+            # ticks instead of queueing one message per file; always send the last
+            now = time.monotonic()
+            if current < total and now - last_post[0] < self.PROGRESS_INTERVAL:
+                return
+            last_post[0] = now
+            self._post('progress', current, total)
         
         try:
-            self.status_var.set("⏳ Executing file operations...")
-            
             # Execute the plan (not dry-run) with progress callback
             result = self.executor.execute_plan(
-                self.current_plan, 
-                self.selected_folder, 
+                plan, 
+                folder, 
                 dry_run=False,
-                progress_callback=update_progress
+                progress_callback=report_progress
             )
             
             # Log the execution results
             self.logger.log_plan_execution(result)
             
-            # Update progress bar to completion
-            self.progress_bar['value'] = self.progress_bar['maximum']
-            self.progress_label.config(text=f"✓ Execution complete!")
-            self.root.update_idletasks()
+            self._post('execution_done', result)
             
+        except Exception as e:
+            self._post('execution_failed', str(e))
+    
+    def _on_execution_progress(self, current: int, total: int):
+        """Update the progress bar for a completed operation"""
+        self.progress_value_var.set(current)
+        percentage = int((current / total) * 100) if total > 0 else 0
+        self.progress_text_var.set(f"⏳ Executing plan... {percentage}% ({current}/{total})")
+    
+    def _on_execution_done(self, result: Dict):
+        """Show the results of a finished plan execution"""
+        try:
             # Display execution results
             self._display_execution_results(result)
             
@@ -2806,7 +3701,7 @@ class BuzzSortApp:
                     f"Operations failed: {result.get('operations_failed', 0)}\n\n"
                     "Check the plan area for detailed execution log."
                 )
-                messagebox.showinfo("Execution Complete", summary_message)
+                dialog = (messagebox.showinfo, "Execution Complete", summary_message)
                 self.status_var.set(
                     f"✓ Plan executed: {result.get('operations_completed', 0)} files organized"
                 )
@@ -2819,27 +3714,38 @@ class BuzzSortApp:
                     f"Operations failed: {error_count}\n\n"
                     "Check the plan area for detailed error log."
                 )
-                messagebox.showwarning("Execution Completed with Errors", summary_message)
+                dialog = (messagebox.showwarning, "Execution Completed with Errors", summary_message)
                 self.status_var.set(
                     f"⚠ Plan executed with {error_count} error(s)"
                 )
             
-        except Exception as e:
-            messagebox.showerror(
-                "Execution Error", 
-                f"An unexpected error occurred during execution:\n\n{str(e)}"
-            )
-            self.status_var.set("❌ Plan execution failed")
-        
+            # Modal dialogs run a nested event loop; show the summary only once
+            # the window is back in its idle state, after the finally below
+            self.root.after_idle(*dialog)
         finally:
-            # Hide progress bar
-            self.progress_frame.grid_remove()
-            
-            # Clear current plan to prevent re-execution
-            self.current_plan = None
-            
-            # Re-enable buttons
-            self._update_button_states()
+            self._finish_execution()
+    
+    def _on_execution_failed(self, error: str):
+        """Handle an exception raised by the execution worker"""
+        self.status_var.set("❌ Plan execution failed")
+        self._finish_execution()
+        
+        self.root.after_idle(
+            messagebox.showerror,
+            "Execution Error", 
+            f"An unexpected error occurred during execution:\n\n{error}"
+        )
+    
+    def _finish_execution(self):
+        """Reset the window after an execution attempt"""
+        # Hide progress bar
+        self.progress_frame.grid_remove()
+        
+        # Clear current plan to prevent re-execution
+        self.current_plan = None
+        
+        # Re-enable buttons
+        self._update_button_states()
     
     def _display_execution_results(self, result: Dict):
         """
@@ -2848,76 +3754,111 @@ class BuzzSortApp:
         Args:
             result: Execution result dictionary from PlanExecutor
         """
-        self.plan_text.config(state=tk.NORMAL)
-        self.plan_text.delete(1.0, tk.END)
+        parts = []
         
         # Header
-        self.plan_text.insert(tk.END, "=" * 60 + "\n")
-        self.plan_text.insert(tk.END, "EXECUTION RESULTS\n")
-        self.plan_text.insert(tk.END, "=" * 60 + "\n\n")
+        parts.append(_SEP60)
+        parts.append(("EXECUTION RESULTS\n", 'header'))
+        parts.append(_SEP60)
+        parts.append("\n")
         
         # Summary
-        self.plan_text.insert(tk.END, "Summary:\n")
-        self.plan_text.insert(tk.END, f"  Status: {'✅ Success' if result.get('success') else '⚠️  Completed with errors'}\n")
-        self.plan_text.insert(tk.END, f"  Folders created: {result.get('folders_created', 0)}\n")
-        self.plan_text.insert(tk.END, f"  Operations completed: {result.get('operations_completed', 0)}\n")
-        self.plan_text.insert(tk.END, f"  Operations failed: {result.get('operations_failed', 0)}\n")
-        self.plan_text.insert(tk.END, f"  Total operations: {result.get('total_operations', 0)}\n\n")
+        parts.append("Summary:\n")
+        parts.append(f"  Status: {'✅ Success' if result.get('success') else '⚠️  Completed with errors'}\n")
+        parts.append(f"  Folders created: {result.get('folders_created', 0)}\n")
+        parts.append(f"  Operations completed: {result.get('operations_completed', 0)}\n")
+        parts.append(f"  Operations failed: {result.get('operations_failed', 0)}\n")
+        parts.append(f"  Total operations: {result.get('total_operations', 0)}\n\n")
         
         # Execution log
         execution_log = result.get('log', [])
         if execution_log:
-            self.plan_text.insert(tk.END, "Execution Log:\n")
-            self.plan_text.insert(tk.END, "-" * 60 + "\n")
+            parts.append(("Execution Log:\n", 'subheader'))
+            parts.append(_RULE60)
             for log_entry in execution_log:
-                self.plan_text.insert(tk.END, f"{log_entry}\n")
-            self.plan_text.insert(tk.END, "\n")
+                parts.append(f"{log_entry}\n")
+            parts.append("\n")
         
         # Errors
         errors = result.get('errors', [])
         if errors:
-            self.plan_text.insert(tk.END, "Errors:\n")
-            self.plan_text.insert(tk.END, "-" * 60 + "\n")
+            parts.append(("Errors:\n", 'subheader'))
+            parts.append(_RULE60)
             for error in errors:
-                self.plan_text.insert(tk.END, f"❌ {error}\n")
-            self.plan_text.insert(tk.END, "\n")
+                parts.append(f"❌ {error}\n")
+            parts.append("\n")
         
-        self.plan_text.insert(tk.END, "=" * 60 + "\n")
+        parts.append(_SEP60)
         
-        self.plan_text.config(state=tk.DISABLED)
+        self._render_text(self.plan_text, parts)
     
-    def _initialize_ai_service(self):
-        """Initialize AI service based on current provider and API key"""
-        try:
-            api_key = AIConfig.get_api_key(self.ai_provider, self.config)
+    @property
+    def ai_service(self) -> Optional[AIServiceInterface]:
+        """
+        AI service for the current provider, created on first use
+        
+        Creating the client is deferred until an analysis needs it, so startup
+        never waits on the AI library or the network.
+        
+        Returns:
+            The AI service, or None if no API key is configured
             
+        Raises:
+            Exception: If the service cannot be created (e.g. missing client library)
+        """
+        if self._ai_service_instance is None:
+            api_key = AIConfig.get_api_key(self.ai_provider, self.config)
             if api_key:
-                self.status_var.set("⏳ Connecting to AI service...")
-                self.root.update()
-                
-                self.ai_service = AIServiceFactory.create_service(
-                    self.ai_provider, 
-                    api_key
-                )
-                
-                # Test the connection
-                if self.ai_service.test_connection():
-                    provider_name = self.ai_provider.value.capitalize()
-                    self.status_var.set(f"✓ Connected to {provider_name} AI service - Ready")
-                else:
-                    self.status_var.set(f"⚠ Warning: Could not verify AI connection")
-            else:
-                self.ai_service = None
-                self.status_var.set("⚠ No AI API key configured - Select a folder to begin")
-                
-        except Exception as e:
+                with self._ai_service_lock:
+                    if self._ai_service_instance is None:
+                        self._ai_service_instance = AIServiceFactory.create_service(
+                            self.ai_provider, 
+                            api_key
+                        )
+        return self._ai_service_instance
+    
+    def _ai_available(self) -> bool:
+        """Check whether AI analysis can be attempted, without creating the service"""
+        return self._ai_service_instance is not None or bool(AIConfig.get_api_key(self.ai_provider, self.config))
+    
+    def _initialize_ai_service(self):
+        """Reset the AI service for the current provider; it connects on first analysis"""
+        self._ai_service_instance = None
+        
+        if AIConfig.get_api_key(self.ai_provider, self.config):
+            self.status_var.set("✓ Ready (AI will connect on first analysis)")
+        else:
+            self.status_var.set("⚠ No AI API key configured - Select a folder to begin")
+    
+    def test_ai_connection(self):
+        """Verify the AI connection on request (File > Test AI Connection)"""
+        if self.is_processing:
+            return
+        
+        api_key = AIConfig.get_api_key(self.ai_provider, self.config)
+        if not api_key:
             messagebox.showwarning(
                 "AI Service Warning", 
-                f"Could not initialize AI service:\n\n{str(e)}\n\n"
+                "No AI API key configured.\n\n"
                 "Please configure your API key in ai_config.json or set environment variable."
             )
-            self.ai_service = None
-            self.status_var.set("⚠ AI service initialization failed - Select a folder to begin")
+            return
+        
+        self.status_var.set("⏳ Connecting to AI service...")
+        threading.Thread(target=self._connection_test_worker, daemon=True).start()
+    
+    def _connection_test_worker(self):
+        """Create the AI service if needed and probe the connection off the Tk thread"""
+        try:
+            # Always a live probe: the user asked for a re-test, so a revoked key
+            # or an outage has to show up right away
+            if self.ai_service.test_connection():
+                provider_name = self.ai_provider.value.capitalize()
+                self._post('status', f"✓ Connected to {provider_name} AI service - Ready")
+            else:
+                self._post('status', "⚠ Warning: Could not verify AI connection")
+        except Exception as e:
+            self._post('status', f"⚠ AI service initialization failed: {str(e)}")
     
     def switch_ai_provider(self, provider: AIProvider):
         """
@@ -2927,11 +3868,11 @@ class BuzzSortApp:
             provider: AIProvider enum value to switch to
         """
         self.ai_provider = provider
-        self._initialize_ai_service()
+        self._ai_service_instance = None  # Fetched from the factory for the new provider on first use
         
-        if self.ai_service:
+        if AIConfig.get_api_key(provider, self.config):
             provider_name = provider.value.capitalize()
-            self.status_var.set(f"Switched to {provider_name} AI provider")
+            self.status_var.set(f"Switched to {provider_name} AI provider (will connect on first use)")
         else:
             self.status_var.set(f"Failed to switch provider - check API key")
     
@@ -47,8 +47,7 @@ def test_claude():
         print(f"❌ Connection test error: {str(e)}")
         return False
     
-    # Test filename analysis
-    print("\nTesting filename analysis...")
+    # Filename and text content analysis go out in one request
     test_files = [
         'report_2024.txt',
         'meeting_notes.txt',
@@ -57,9 +56,16 @@ def test_claude():
         'script.py',
         'data.csv'
     ]
+    sample_text = "This is a recipe for chocolate cake. Ingredients: flour, sugar, cocoa powder, eggs."
+    results = service.analyze_batch([
+        {'op': 'filenames', 'files': test_files},
+        {'op': 'text', 'name': 'document1.txt', 'content': sample_text}
+    ])
     
+    # Test filename analysis
+    print("\nTesting filename analysis...")
     try:
-        result = service.analyze_filenames(test_files)
+        result = results[0]
         
         if result.get('error'):
             print(f"❌ Analysis failed: {result['error']}")
@@ -70,9 +76,10 @@ def test_claude():
         print(f"  Generated {len(clusters)} clusters")
         
         for i, cluster in enumerate(clusters, 1):
-            print(f"\n  Cluster {i}: {cluster.get('category', 'Unknown')}")
-            print(f"    Files: {len(cluster.get('files', []))}")
-            print(f"    Folder: {cluster.get('suggested_folder', 'N/A')}")
+            category = cluster.get('category', 'Unknown')
+            files = cluster.get('files', ())
+            folder = cluster.get('suggested_folder', 'N/A')
+            print(f"\n  Cluster {i}: {category}\n    Files: {len(files)}\n    Folder: {folder}")
             
     except Exception as e:
         print(f"❌ Filename analysis error: {str(e)}")
@@ -81,10 +88,9 @@ def test_claude():
     # Test text content analysis
     print("\n" + "=" * 60)
     print("Testing text content analysis...")
-    sample_text = "This is a recipe for chocolate cake. Ingredients: flour, sugar, cocoa powder, eggs."
     
     try:
-        result = service.analyze_text_content('document1.txt', sample_text)
+        result = results[1]
         
         if result.get('error'):
             print(f"❌ Text analysis failed: {result['error']}")
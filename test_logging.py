@@ -5,7 +5,9 @@ Test script for the logging functionality
 
 import os
 import sys
+import traceback
 from pathlib import Path
+from datetime import datetime
 
 # Add the current directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -13,74 +15,104 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 # Import the OperationLogger class
 from file_janitor import OperationLogger
 
+# Informational output is only shown with -v or FJ_TEST_VERBOSE=1; failures,
+# warnings and the summary are always printed
+VERBOSE = '-v' in sys.argv or os.environ.get('FJ_TEST_VERBOSE', '0') == '1'
+vprint = print if VERBOSE else (lambda *args, **kwargs: None)
+
 def test_operation_logger():
     """Test the OperationLogger functionality"""
-    print("Testing OperationLogger...")
-    print("-" * 60)
+    vprint("Testing OperationLogger...")
+    vprint("-" * 60)
     
     # Create logger instance
     logger = OperationLogger()
-    print(f"✓ Logger initialized")
-    print(f"  Log file: {logger.get_log_file_path()}")
-    
-    # Test logging various operations
-    print("\n1. Testing scan operation logging...")
-    logger.log_scan("/test/folder", 150, ["Error 1", "Error 2"])
-    print("  ✓ Scan logged")
-    
-    print("\n2. Testing AI analysis logging...")
-    logger.log_ai_analysis(150, 5, success=True)
-    print("  ✓ AI analysis logged (success)")
-    
-    logger.log_ai_analysis(100, 0, success=False, error="API quota exceeded")
-    print("  ✓ AI analysis logged (failure)")
-    
-    print("\n3. Testing plan creation logging...")
-    logger.log_plan_creation(5, 150, success=True)
-    print("  ✓ Plan creation logged")
-    
-    print("\n4. Testing plan execution logging...")
-    test_result = {
-        'dry_run': False,
-        'folders_created': 5,
-        'operations_completed': 145,
-        'operations_failed': 5,
-        'log': [
-            'Created folder: documents',
-            'Moved: file1.txt -> documents/file1.txt',
-            '[ERROR] Failed to move file2.txt'
-        ]
-    }
-    logger.log_plan_execution(test_result)
-    print("  ✓ Plan execution logged")
+    vprint(f"✓ Logger initialized")
+    vprint(f"  Log file: {logger.get_log_file_path()}")
     
-    print("\n5. Testing error logging...")
-    logger.log_error('test_error', 'This is a test error message')
-    print("  ✓ Error logged")
+    # Test logging various operations, written to the log file as one batch
+    with logger.batch():
+        vprint("\n1. Testing scan operation logging...")
+        logger.log_scan("/test/folder", 150, ["Error 1", "Error 2"])
+        vprint("  ✓ Scan logged")
+        
+        vprint("\n2. Testing AI analysis logging...")
+        logger.log_ai_analysis(150, 5, success=True)
+        vprint("  ✓ AI analysis logged (success)")
+        
+        logger.log_ai_analysis(100, 0, success=False, error="API quota exceeded")
+        vprint("  ✓ AI analysis logged (failure)")
+        
+        vprint("\n3. Testing plan creation logging...")
+        logger.log_plan_creation(5, 150, success=True)
+        vprint("  ✓ Plan creation logged")
+        
+        vprint("\n4. Testing plan execution logging...")
+        test_result = {
+            'dry_run': False,
+            'folders_created': 5,
+            'operations_completed': 145,
+            'operations_failed': 5,
+            'log': [
+                'Created folder: documents',
+                'Moved: file1.txt -> documents/file1.txt',
+                '[ERROR] Failed to move file2.txt'
+            ]
+        }
+        logger.log_plan_execution(test_result)
+        vprint("  ✓ Plan execution logged")
+        
+        vprint("\n5. Testing error logging...")
+        logger.log_error('test_error', 'This is a test error message')
+        vprint("  ✓ Error logged")
     
-    print("\n6. Testing operation history retrieval...")
+    vprint("\n6. Testing operation history retrieval...")
     history = logger.get_operation_history()
-    print(f"  ✓ Retrieved {len(history)} operations from history")
+    vprint(f"  ✓ Retrieved {len(history)} operations from history")
     
-    print("\n7. Displaying operation history:")
-    print("-" * 60)
+    vprint("\n7. Displaying operation history:")
+    vprint("-" * 60)
     for i, op in enumerate(history, 1):
         status = "✓" if op['success'] else "✗"
-        print(f"  {i}. [{status}] {op['type']}: {op['details'][:60]}...")
+        vprint(f"  {i}. [{status}] {op['type']}: {op['details'][:60]}...")
     
-    print("\n" + "=" * 60)
+    vprint("\n" + "=" * 60)
     print("✓ All logging tests passed!")
     print(f"✓ Log file created at: {logger.get_log_file_path()}")
-    print("=" * 60)
+    vprint("=" * 60)
+    
+    return True
+
+def test_overlapping_batches():
+    """Batches from two loggers that overlap write every record exactly once"""
+    vprint("\nTesting overlapping batches...")
+    
+    first, second = OperationLogger(), OperationLogger()
+    log_path = Path(first.get_log_file_path())
+    stamp = datetime.now().isoformat()
+    markers = [f"overlap first {stamp}", f"overlap second {stamp}"]
+    
+    with first.batch():
+        with second.batch():
+            first.log_operation('batch_test', markers[0])
+            if markers[0] in log_path.read_text(encoding='utf-8'):
+                raise AssertionError("Record written before the batch exited")
+        second.log_operation('batch_test', markers[1])
+    
+    content = log_path.read_text(encoding='utf-8')
+    counts = [content.count(marker) for marker in markers]
+    if counts != [1, 1]:
+        raise AssertionError(f"Expected each record once in the log file, got {counts}")
+    vprint("  ✓ Each record written once, after the batch exited")
     
     return True
 
 if __name__ == "__main__":
     try:
         test_operation_logger()
+        test_overlapping_batches()
         print("\n✓ Test completed successfully!")
     except Exception as e:
         print(f"\n✗ Test failed: {str(e)}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
@@ -3,159 +3,276 @@
 Verify that all dependencies are installed correctly
 """
 
+import os
 import sys
+import json
+from pathlib import Path
+import importlib
+import importlib.util
+from functools import lru_cache
 
-def check_imports():
-    """Check that all required packages can be imported"""
-    print("Checking dependencies...")
-    print("=" * 60)
-    
-    errors = []
-    
-    # Check tkinter (built-in)
+# Third-party and optional dependencies: (display name, module to probe, purpose)
+DEPENDENCIES = [
+    ("tkinter", "tkinter", "GUI framework"),
+    ("anthropic", "anthropic", "Claude AI"),
+    ("Pillow", "PIL.Image", "Image processing"),
+]
+
+# Separator line around each report section
+BANNER = "=" * 60
+
+# API key status text, indexed by whether the key is configured
+STATUS = ("✗ not set", "✓ configured")
+
+# Standard library modules the application relies on
+STDLIB_MODULES = ("pathlib", "shutil", "json", "logging")
+
+# Written once every dependency checks out; later runs trust it until the
+# interpreter or one of its import directories changes
+MANIFEST_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".verify_manifest.json")
+
+@lru_cache(maxsize=None)
+def has_module(name):
+    """Check whether a module can be found, without importing it"""
     try:
-        import tkinter as tk
-        print("✓ tkinter (GUI framework)")
-    except ImportError as e:
-        errors.append(f"✗ tkinter: {str(e)}")
-        print(f"✗ tkinter: Not available")
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+def probe_module(name, deep=False):
+    """
+    Check a dependency
     
-    # Check google-generativeai
+    Args:
+        name: Dotted module name
+        deep: Actually import the module instead of only locating its
+            top-level package (find_spec on a dotted name imports the parent)
+        
+    Returns:
+        None if the module is usable, otherwise an error message
+    """
+    # Already imported in this interpreter, so it is installed and loads
+    if name in sys.modules:
+        return None
+    if not deep:
+        package = name.partition('.')[0]
+        return None if has_module(package) else f"No module named '{package}'"
     try:
-        import google.generativeai as genai
-        print("✓ google-generativeai (Gemini AI)")
-    except ImportError as e:
-        errors.append(f"✗ google-generativeai: {str(e)}")
-        print(f"✗ google-generativeai: Not installed")
+        importlib.import_module(name)
+        return None
+    except Exception as e:
+        return str(e)
+
+def environment_fingerprint():
+    """
+    Identify the interpreter and the state of its import directories
     
-    # Check anthropic
+    Installing or removing a package adds or deletes entries in a sys.path
+    directory, which changes that directory's mtime. The manifest's own
+    directory is left out since writing the manifest changes it.
+    """
+    manifest_dir = os.path.dirname(MANIFEST_FILE)
+    directories = {}
+    for entry in sys.path:
+        path = os.path.abspath(entry or '.')
+        if path == manifest_dir:
+            continue
+        try:
+            directories[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+    return {"python": sys.version, "executable": sys.executable, "path": directories}
+
+def manifest_matches(deep=False):
+    """Check whether a manifest from an earlier successful run still applies"""
     try:
-        import anthropic
-        print("✓ anthropic (Claude AI)")
-    except ImportError as e:
-        errors.append(f"✗ anthropic: {str(e)}")
-        print(f"✗ anthropic: Not installed")
-    
-    # Check Pillow
+        with open(MANIFEST_FILE, 'rb') as f:
+            manifest = json.load(f)
+        return (manifest["modules"] == [module for _, module, _ in DEPENDENCIES]
+                and (manifest["deep"] or not deep)
+                and manifest["fingerprint"] == environment_fingerprint())
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+def save_manifest(deep=False):
+    """Record that every dependency checked out in this environment"""
+    manifest = {
+        "modules": [module for _, module, _ in DEPENDENCIES],
+        "deep": deep,
+        "fingerprint": environment_fingerprint()
+    }
     try:
-        from PIL import Image
-        print("✓ Pillow (Image processing)")
-    except ImportError as e:
-        errors.append(f"✗ Pillow: {str(e)}")
-        print(f"✗ Pillow: Not installed")
+        with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+    except OSError:
+        pass  # Only an optimization; the next run probes again
+
+def check_imports(out, deep=False):
+    """Check that all required packages are installed (and importable with deep=True)"""
+    out.append("Checking dependencies...")
+    out.append(BANNER)
     
-    # Check standard library modules
-    try:
-        import pathlib
-        import shutil
-        import json
-        import logging
-        print("✓ Standard library modules")
-    except ImportError as e:
-        errors.append(f"✗ Standard library: {str(e)}")
-        print(f"✗ Standard library: Missing modules")
+    errors = []
+    
+    if manifest_matches(deep):
+        results = [None] * len(DEPENDENCIES)
+    else:
+        results = [probe_module(module, deep) for _, module, _ in DEPENDENCIES]
+        if not any(results):
+            save_manifest(deep)
     
-    print("=" * 60)
+    for (label, module, purpose), error in zip(DEPENDENCIES, results):
+        if error is None:
+            out.append(f"✓ {label} ({purpose})")
+        else:
+            errors.append(f"✗ {label}: {error}")
+            out.append(f"✗ {label}: Not installed")
+    
+    # Check standard library modules; located only, loading logging and
+    # shutil here would just pay their import cost for nothing
+    missing = [name for name in STDLIB_MODULES if not has_module(name)]
+    if not missing:
+        out.append("✓ Standard library modules")
+    else:
+        errors.append(f"✗ Standard library: missing {', '.join(missing)}")
+        out.append(f"✗ Standard library: Missing modules")
+    
+    out.append(BANNER)
     
     if errors:
-        print(f"\n❌ {len(errors)} error(s) found:")
+        out.append(f"\n❌ {len(errors)} error(s) found:")
         for error in errors:
-            print(f"  {error}")
-        print("\nPlease install missing dependencies:")
-        print("  pip install -r requirements.txt")
+            out.append(f"  {error}")
+        out.append("\nPlease install missing dependencies:")
+        out.append("  pip install -r requirements.txt")
         return False
     else:
-        print("\n✅ All dependencies are installed correctly!")
+        out.append("\n✅ All dependencies are installed correctly!")
         return True
 
-def check_config():
-    """Check if configuration file exists"""
-    print("\nChecking configuration...")
-    print("=" * 60)
+def read_config_summary(f):
+    """
+    Parse an open config file down to what check_config reports
     
-    import os
-    from pathlib import Path
+    Args:
+        f: ai_config.json opened in binary mode
+        
+    Returns:
+        (provider, has_gemini, has_claude)
+    """
+    # json.load detects the encoding of a binary file itself, skipping the text decode layer
+    get = json.load(f).get
+    provider = get('provider') or 'not set'
+    has_gemini = bool((get('gemini_api_key') or '').strip())
+    has_claude = bool((get('claude_api_key') or '').strip())
+    return provider, has_gemini, has_claude
+
+def check_config(out):
+    """Check if configuration file exists"""
+    out.append("\nChecking configuration...")
+    out.append(BANNER)
     
     config_file = Path("ai_config.json")
     
-    if config_file.exists():
-        print("✓ ai_config.json found")
-        
-        try:
-            import json
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-            
-            provider = config.get('provider', 'not set')
-            has_gemini = bool(config.get('gemini_api_key', '').strip())
-            has_claude = bool(config.get('claude_api_key', '').strip())
-            
-            print(f"  Provider: {provider}")
-            print(f"  Gemini API key: {'✓ configured' if has_gemini else '✗ not set'}")
-            print(f"  Claude API key: {'✓ configured' if has_claude else '✗ not set'}")
-            
-            if provider == 'gemini' and not has_gemini:
-                print("\n⚠ Warning: Gemini provider selected but no API key configured")
-            elif provider == 'claude' and not has_claude:
-                print("\n⚠ Warning: Claude provider selected but no API key configured")
-            
-        except Exception as e:
-            print(f"✗ Error reading config: {str(e)}")
+    # Opening the file is the existence check; no separate stat beforehand
+    try:
+        with open(config_file, 'rb') as f:
+            provider, has_gemini, has_claude = read_config_summary(f)
+    except FileNotFoundError:
+        out.append("✗ ai_config.json not found")
+        out.append("\n⚠ Please create ai_config.json with your API keys")
+        out.append("  See .env.example for template")
+    except Exception as e:
+        out.append("✓ ai_config.json found")
+        out.append(f"✗ Error reading config: {str(e)}")
     else:
-        print("✗ ai_config.json not found")
-        print("\n⚠ Please create ai_config.json with your API keys")
-        print("  See .env.example for template")
+        out.append("✓ ai_config.json found")
+        
+        out.append(f"  Provider: {provider}")
+        out.append(f"  Gemini API key: {STATUS[has_gemini]}")
+        out.append(f"  Claude API key: {STATUS[has_claude]}")
+        
+        if provider == 'gemini' and not has_gemini:
+            out.append("\n⚠ Warning: Gemini provider selected but no API key configured")
+        elif provider == 'claude' and not has_claude:
+            out.append("\n⚠ Warning: Claude provider selected but no API key configured")
     
-    print("=" * 60)
+    out.append(BANNER)
 
-def check_python_version():
+def check_python_version(out):
     """Check Python version"""
-    print("\nChecking Python version...")
-    print("=" * 60)
+    out.append("\nChecking Python version...")
+    out.append(BANNER)
     
     version = sys.version_info
-    version_str = f"{version.major}.{version.minor}.{version.micro}"
-    
-    print(f"Python version: {version_str}")
+    ok = version[:2] >= (3, 9)
     
-    if version.major >= 3 and version.minor >= 9:
-        print("✓ Python version is compatible (3.9+)")
-        return True
-    else:
-        print("✗ Python 3.9 or higher is required")
-        return False
+    out.append(f"Python version: {version.major}.{version.minor}.{version.micro}")
+    out.append("✓ Python version is compatible (3.9+)" if ok else "✗ Python 3.9 or higher is required")
+    out.append(BANNER)
     
-    print("=" * 60)
+    return ok
 
 def main():
     """Main verification function"""
-    print("\n" + "=" * 60)
-    print("INTELLIGENT FILE JANITOR - INSTALLATION VERIFICATION")
-    print("=" * 60)
+    # The checks append their report lines here; it is written to stdout in
+    # one go at the end instead of one print per line
+    out = []
+    try:
+        return run_checks(out)
+    finally:
+        write_report(out)
+
+def write_report(lines):
+    """Encode the report once and write it straight to stdout's byte buffer"""
+    report = "\n".join(lines) + "\n"
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:  # stdout replaced by a text-only stream
+        sys.stdout.write(report)
+        sys.stdout.flush()
+        return
     
-    # Check Python version
-    python_ok = check_python_version()
+    if os.linesep != "\n":  # the text layer would have translated newlines
+        report = report.replace("\n", os.linesep)
+    sys.stdout.flush()
+    buffer.write(report.encode(sys.stdout.encoding or 'utf-8', sys.stdout.errors or 'strict'))
+    buffer.flush()
+
+def run_checks(out):
+    """Run every check, collecting the report lines in out"""
+    out.append("\n" + BANNER)
+    out.append("INTELLIGENT FILE JANITOR - INSTALLATION VERIFICATION")
+    out.append(BANNER)
+    
+    # Check Python version; nothing else matters on an unsupported interpreter
+    python_ok = check_python_version(out)
+    if not python_ok:
+        out.append("\n" + BANNER)
+        out.append("❌ Installation verification failed")
+        out.append("\nPlease upgrade to Python 3.9 or higher and try again")
+        out.append(BANNER)
+        return False
     
-    # Check imports
-    imports_ok = check_imports()
+    # Check imports; --deep imports each package instead of only locating it
+    imports_ok = check_imports(out, deep='--deep' in sys.argv)
     
     # Check configuration
-    check_config()
+    check_config(out)
     
     # Final summary
-    print("\n" + "=" * 60)
-    if python_ok and imports_ok:
-        print("✅ Installation verified successfully!")
-        print("\nYou can now run the application:")
-        print("  python file_janitor.py")
-        print("\nOr run tests:")
-        print("  python test_workflow.py")
+    out.append("\n" + BANNER)
+    if imports_ok:
+        out.append("✅ Installation verified successfully!")
+        out.append("\nYou can now run the application:")
+        out.append("  python file_janitor.py")
+        out.append("\nOr run tests:")
+        out.append("  python test_workflow.py")
     else:
-        print("❌ Installation verification failed")
-        print("\nPlease fix the issues above and try again")
-    print("=" * 60)
+        out.append("❌ Installation verification failed")
+        out.append("\nPlease fix the issues above and try again")
+    out.append(BANNER)
     
-    return python_ok and imports_ok
+    return imports_ok
 
 if __name__ == '__main__':
     success = main()